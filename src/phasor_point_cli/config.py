@@ -108,7 +108,9 @@ class ConfigurationManager:
             self.logger.info(f"Config file not found: {self.config_path}, using embedded defaults")
 
         if config_data is None:
-            config_data = _get_embedded_default_config()
+            # Share the embedded defaults instead of copying them: ``_config`` is never
+            # mutated and every accessor hands out a deep copy.
+            config_data = _EMBEDDED_DEFAULT_CONFIG
 
         self._config = config_data
 
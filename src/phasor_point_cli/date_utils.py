@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import os
 import warnings
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from typing import Optional
 
 import pandas as pd
@@ -22,6 +22,11 @@ from .models import DateRange
 class DateRangeCalculator:
     """Calculates date ranges from command arguments."""
 
+    @staticmethod
+    def _now() -> datetime:
+        """Return the current local time (patched in tests to freeze the clock)."""
+        return datetime.now()
+
     @staticmethod
     def _parse_local_datetime(date_string: str) -> datetime:
         """
@@ -63,17 +68,18 @@ class DateRangeCalculator:
             return pytz.UTC
 
     @staticmethod
-    def convert_to_database_time(local_dt: datetime) -> datetime:
+    def convert_to_database_time(local_dt: datetime, tz: Optional[tzinfo] = None) -> datetime:
         """
         Convert user's local time to database time (CET, UTC+1 fixed, no DST).
 
         Args:
             local_dt: Naive datetime in user's local timezone
+            tz: User's timezone (default: resolved via get_local_timezone)
 
         Returns:
             Naive datetime in database timezone (UTC+1) for SQL queries
         """
-        local_tz = DateRangeCalculator.get_local_timezone()
+        local_tz = tz if tz is not None else DateRangeCalculator.get_local_timezone()
 
         # Localize to system's local timezone
         if local_tz and hasattr(local_tz, "localize"):
@@ -92,18 +98,19 @@ class DateRangeCalculator:
         return db_dt.replace(tzinfo=None)
 
     @staticmethod
-    def get_utc_offset(local_dt: datetime) -> str:
+    def get_utc_offset(local_dt: datetime, tz: Optional[tzinfo] = None) -> str:
         """
         Get UTC offset string for a datetime in user's local timezone.
 
         Args:
             local_dt: Naive datetime in user's local timezone
+            tz: User's timezone (default: resolved via get_local_timezone)
 
         Returns:
             Offset string in format "+HH:MM" or "-HH:MM"
         """
         try:
-            local_tz = DateRangeCalculator.get_local_timezone()
+            local_tz = tz if tz is not None else DateRangeCalculator.get_local_timezone()
             if local_tz is None:
                 return "+00:00"
 
@@ -130,7 +137,9 @@ class DateRangeCalculator:
             return "+00:00"
 
     @staticmethod
-    def calculate(args, reference_time: Optional[datetime] = None) -> DateRange:
+    def calculate(
+        args, reference_time: Optional[datetime] = None, tz: Optional[tzinfo] = None
+    ) -> DateRange:
         """
         Calculate start and end dates based on command arguments.
 
@@ -142,6 +151,7 @@ class DateRangeCalculator:
         Args:
             args: Parsed command-line arguments with start, end, minutes, hours, days
             reference_time: Reference datetime for relative calculations (default: now)
+            tz: User's timezone for database conversions (default: TZ env / system)
 
         Returns:
             DateRange with start_date, end_date, and batch_timestamp
@@ -155,7 +165,7 @@ class DateRangeCalculator:
             >>> # Returns date range for last 60 minutes
         """
         if reference_time is None:
-            reference_time = datetime.now()
+            reference_time = DateRangeCalculator._now()
 
         # Priority: --start + duration, then duration alone, then --start + --end
         if getattr(args, "start", None) and DateRangeCalculator._has_duration(args):
@@ -163,26 +173,28 @@ class DateRangeCalculator:
             start_dt = DateRangeCalculator._parse_local_datetime(args.start)
             duration = DateRangeCalculator._extract_duration(args)
             end_dt = start_dt + duration
-            return DateRange(start=start_dt, end=end_dt)
+            return DateRange(start=start_dt, end=end_dt, tz=tz)
 
         if DateRangeCalculator._has_duration(args):
             # Duration alone: go back N minutes/hours/days from now
             duration = DateRangeCalculator._extract_duration(args)
             end_dt = reference_time
             start_dt = end_dt - duration
-            return DateRange(start=start_dt, end=end_dt)
+            return DateRange(start=start_dt, end=end_dt, tz=tz)
 
         if getattr(args, "start", None) and getattr(args, "end", None):
             # Absolute time range
             start_dt = DateRangeCalculator._parse_local_datetime(args.start)
             end_dt = DateRangeCalculator._parse_local_datetime(args.end)
-            return DateRange(start=start_dt, end=end_dt)
+            return DateRange(start=start_dt, end=end_dt, tz=tz)
 
         raise ValueError("Please specify either --start/--end dates, --minutes, --hours, or --days")
 
     @staticmethod
     def calculate_from_duration(
-        duration_minutes: int, reference_time: Optional[datetime] = None
+        duration_minutes: int,
+        reference_time: Optional[datetime] = None,
+        tz: Optional[tzinfo] = None,
     ) -> DateRange:
         """
         Calculate date range from duration in minutes.
@@ -192,6 +204,7 @@ class DateRangeCalculator:
         Args:
             duration_minutes: Duration in minutes
             reference_time: End time for the range (default: now)
+            tz: User's timezone for database conversions (default: TZ env / system)
 
         Returns:
             DateRange going backward from reference_time
@@ -201,14 +214,16 @@ class DateRangeCalculator:
             >>> # Returns range for last 60 minutes
         """
         if reference_time is None:
-            reference_time = datetime.now()
+            reference_time = DateRangeCalculator._now()
 
         end_dt = reference_time
         start_dt = end_dt - timedelta(minutes=duration_minutes)
-        return DateRange(start=start_dt, end=end_dt)
+        return DateRange(start=start_dt, end=end_dt, tz=tz)
 
     @staticmethod
-    def calculate_from_start_and_duration(start_date: str, duration: timedelta) -> DateRange:
+    def calculate_from_start_and_duration(
+        start_date: str, duration: timedelta, tz: Optional[tzinfo] = None
+    ) -> DateRange:
         """
         Calculate date range from start date and duration.
 
@@ -217,6 +232,7 @@ class DateRangeCalculator:
         Args:
             start_date: Start date as string (parseable by pandas)
             duration: Duration as timedelta
+            tz: User's timezone for database conversions (default: TZ env / system)
 
         Returns:
             DateRange going forward from start_date
@@ -229,7 +245,7 @@ class DateRangeCalculator:
         """
         start_dt = DateRangeCalculator._parse_local_datetime(start_date)
         end_dt = start_dt + duration
-        return DateRange(start=start_dt, end=end_dt)
+        return DateRange(start=start_dt, end=end_dt, tz=tz)
 
     @staticmethod
     def _has_duration(args) -> bool:
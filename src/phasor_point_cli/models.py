@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from collections.abc import Iterable, Sequence
 from dataclasses import asdict, dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, tzinfo
 from pathlib import Path
 from typing import Any, Optional
 
@@ -198,6 +198,8 @@ class DateRange:
 
     start: datetime  # User's local time as provided (inclusive)
     end: datetime  # User's local time as provided (exclusive)
+    # User's timezone; None resolves it from the TZ env var / system on each conversion
+    tz: Optional[tzinfo] = field(default=None, compare=False, repr=False)
 
     def validate(self) -> None:
         if self.start > self.end:
@@ -220,8 +222,8 @@ class DateRange:
         """
         from .date_utils import DateRangeCalculator  # noqa: PLC0415 - avoid circular import
 
-        db_start = DateRangeCalculator.convert_to_database_time(self.start)
-        db_end = DateRangeCalculator.convert_to_database_time(self.end)
+        db_start = DateRangeCalculator.convert_to_database_time(self.start, tz=self.tz)
+        db_end = DateRangeCalculator.convert_to_database_time(self.end, tz=self.tz)
         return db_start, db_end
 
     def as_filename_format(self) -> tuple[str, str]:
@@ -245,8 +247,8 @@ class DateRange:
         """
         from .date_utils import DateRangeCalculator  # noqa: PLC0415 - avoid circular import
 
-        start_offset = DateRangeCalculator.get_utc_offset(self.start)
-        end_offset = DateRangeCalculator.get_utc_offset(self.end)
+        start_offset = DateRangeCalculator.get_utc_offset(self.start, tz=self.tz)
+        end_offset = DateRangeCalculator.get_utc_offset(self.end, tz=self.tz)
         return start_offset, end_offset
 
     def get_timezone_name(self) -> str:
@@ -258,7 +260,7 @@ class DateRange:
         """
         from .date_utils import DateRangeCalculator  # noqa: PLC0415 - avoid circular import
 
-        local_tz = DateRangeCalculator.get_local_timezone()
+        local_tz = self.tz if self.tz is not None else DateRangeCalculator.get_local_timezone()
         return str(local_tz) if local_tz else "UTC"
 
 
@@ -8,6 +8,7 @@ power metrics.
 
 from __future__ import annotations
 
+import functools
 import logging
 import re
 from collections.abc import Iterable, Sequence
@@ -22,6 +23,103 @@ if TYPE_CHECKING:
     from .user_output import UserOutput
 
 
+_VOLTAGE_PHASES: tuple[tuple[str, str], ...] = (
+    (
+        "va",
+        r"^v_.*_va1_[ma]$|^va1_[ma]$",
+    ),  # v_ta31_va1_m, va1_m (phasor name ends with va1)
+    (
+        "vb",
+        r"^v_.*_vb1_[ma]$|^vb1_[ma]$",
+    ),  # v_ta31_vb1_m, vb1_m (phasor name ends with vb1)
+    (
+        "vc",
+        r"^v_.*_vc1_[ma]$|^vc1_[ma]$",
+    ),  # v_ta31_vc1_m, vc1_m (phasor name ends with vc1)
+    (
+        "v1",
+        r"^v_.*_v1(?!\d)(?:_1)?_[ma]$|^v1(?!\d)(?:_1)?_[ma]$",
+    ),  # v_ta31_v1_1_m, v_ta31_v1_m, v1_1_m, v1_m (phasor name ends with v1 or v1_1)
+    (
+        "v0",
+        r"^v_.*_v0(?!\d)(?:_1)?_[ma]$|^v0(?!\d)(?:_1)?_[ma]$",
+    ),  # v_ta31_v0_1_m, v_ta31_v0_m, v0_1_m, v0_m (phasor name ends with v0 or v0_1)
+    (
+        "v2",
+        r"^v_.*_v2(?!\d)(?:_1)?_[ma]$|^v2(?!\d)(?:_1)?_[ma]$",
+    ),  # v_ta31_v2_1_m, v_ta31_v2_m, v2_1_m, v2_m (phasor name ends with v2 or v2_1)
+)
+_CURRENT_PHASES: tuple[tuple[str, str], ...] = (
+    (
+        "ia",
+        r"^i_.*_ia1_[ma]$|^ia1_[ma]$",
+    ),  # i_ta31_ia1_m, ia1_m (phasor name ends with ia1)
+    (
+        "ib",
+        r"^i_.*_ib1_[ma]$|^ib1_[ma]$",
+    ),  # i_ta31_ib1_m, ib1_m (phasor name ends with ib1)
+    (
+        "ic",
+        r"^i_.*_ic1_[ma]$|^ic1_[ma]$",
+    ),  # i_ta31_ic1_m, ic1_m (phasor name ends with ic1)
+    (
+        "i1",
+        r"^i_.*_i1(?!\d)(?:_1)?_[ma]$|^i1(?!\d)(?:_1)?_[ma]$",
+    ),  # i_ta31_i1_1_m, i_ta31_i1_m, i1_1_m, i1_m (phasor name ends with i1 or i1_1)
+    (
+        "i0",
+        r"^i_.*_i0(?!\d)(?:_1)?_[ma]$|^i0(?!\d)(?:_1)?_[ma]$",
+    ),  # i_ta31_i0_1_m, i_ta31_i0_m, i0_1_m, i0_m (phasor name ends with i0 or i0_1)
+    (
+        "i2",
+        r"^i_.*_i2(?!\d)(?:_1)?_[ma]$|^i2(?!\d)(?:_1)?_[ma]$",
+    ),  # i_ta31_i2_1_m, i_ta31_i2_m, i2_1_m, i2_m (phasor name ends with i2 or i2_1)
+)
+
+
+def _find_candidates_regex(
+    columns: Sequence[str],
+    phase_patterns: Sequence[tuple[str, str]],
+    suffix: str,
+) -> dict[str, str]:
+    """Match columns using regex for robust detection based on schema structure."""
+    mapping: dict[str, str] = {}
+    for phase_name, pattern in phase_patterns:
+        regex = re.compile(pattern)
+        # Schema: {v|i}_<PHASOR_NAME>_{m|a}
+        candidates = [col for col in columns if col.endswith(suffix) and regex.search(col)]
+        if candidates:
+            # Prefer standard notation: va1/vb1/vc1 for phases, v1_1/v0_1/v2_1 for sequences
+            if len(phase_name) == 2 and phase_name[1] in "abc":
+                # Phase components: prefer 'va1_', 'vb1_', 'vc1_' or 'ia1_', 'ib1_', 'ic1_'
+                # e.g., v_ta31_va1_m contains 'va1_', i_ta31_ia1_m contains 'ia1_'
+                preferred = next(
+                    (col for col in candidates if f"{phase_name}1_" in col), candidates[0]
+                )
+            elif len(phase_name) == 2 and phase_name[1] in "012":
+                # Sequence components: prefer 'v1_1_', 'v0_1_', 'v2_1_' or 'i1_1_', etc.
+                # e.g., v_ta31_v1_1_m contains 'v1_1_', i_ta31_i1_1_m contains 'i1_1_'
+                preferred = next(
+                    (col for col in candidates if f"{phase_name}_1_" in col), candidates[0]
+                )
+            else:
+                preferred = candidates[0]
+            mapping[phase_name] = preferred
+    return mapping
+
+
+@functools.lru_cache(maxsize=32)
+def _detect_columns_cached(columns: tuple[str, ...]) -> PhasorColumnMap:
+    """Return the phasor column map for a column signature (cached, do not mutate)."""
+    return PhasorColumnMap(
+        voltage_magnitude=_find_candidates_regex(columns, _VOLTAGE_PHASES, "_m"),
+        voltage_angle=_find_candidates_regex(columns, _VOLTAGE_PHASES, "_a"),
+        current_magnitude=_find_candidates_regex(columns, _CURRENT_PHASES, "_m"),
+        current_angle=_find_candidates_regex(columns, _CURRENT_PHASES, "_a"),
+        frequency=[column for column in columns if column.startswith(("f", "dfdt"))],
+    )
+
+
 class PowerCalculator:
     """Compute power metrics from voltage and current phasor measurements."""
 
@@ -31,122 +129,35 @@ class PowerCalculator:
         self.logger = logger or logging.getLogger("phasor_cli")
         self.output = output
 
-    # ---------------------------------------------------------------- Private --
-    def _find_candidates_regex(
-        self,
-        df: pd.DataFrame,
-        phase_patterns: Sequence[tuple[str, str]],
-        suffix: str,
-    ) -> dict[str, str]:
-        """Match columns using regex for robust detection based on schema structure."""
-        mapping: dict[str, str] = {}
-        for phase_name, pattern in phase_patterns:
-            regex = re.compile(pattern)
-            # Schema: {v|i}_<PHASOR_NAME>_{m|a}
-            candidates = [col for col in df.columns if col.endswith(suffix) and regex.search(col)]
-            if candidates:
-                # Prefer standard notation: va1/vb1/vc1 for phases, v1_1/v0_1/v2_1 for sequences
-                if len(phase_name) == 2 and phase_name[1] in "abc":
-                    # Phase components: prefer 'va1_', 'vb1_', 'vc1_' or 'ia1_', 'ib1_', 'ic1_'
-                    # e.g., v_ta31_va1_m contains 'va1_', i_ta31_ia1_m contains 'ia1_'
-                    preferred = next(
-                        (col for col in candidates if f"{phase_name}1_" in col), candidates[0]
-                    )
-                elif len(phase_name) == 2 and phase_name[1] in "012":
-                    # Sequence components: prefer 'v1_1_', 'v0_1_', 'v2_1_' or 'i1_1_', etc.
-                    # e.g., v_ta31_v1_1_m contains 'v1_1_', i_ta31_i1_1_m contains 'i1_1_'
-                    preferred = next(
-                        (col for col in candidates if f"{phase_name}_1_" in col), candidates[0]
-                    )
-                else:
-                    preferred = candidates[0]
-                mapping[phase_name] = preferred
-        return mapping
-
     # --------------------------------------------------------------- Detection --
     def detect_columns(self, df: pd.DataFrame) -> PhasorColumnMap:
         """Analyse dataframe columns and return a structured phasor column map."""
         if self.logger:
             self.logger.info("Detecting voltage and current columns...")
 
-        freq_cols = [column for column in df.columns if column.startswith(("f", "dfdt"))]
-
-        voltage_phases = [
-            (
-                "va",
-                r"^v_.*_va1_[ma]$|^va1_[ma]$",
-            ),  # v_ta31_va1_m, va1_m (phasor name ends with va1)
-            (
-                "vb",
-                r"^v_.*_vb1_[ma]$|^vb1_[ma]$",
-            ),  # v_ta31_vb1_m, vb1_m (phasor name ends with vb1)
-            (
-                "vc",
-                r"^v_.*_vc1_[ma]$|^vc1_[ma]$",
-            ),  # v_ta31_vc1_m, vc1_m (phasor name ends with vc1)
-            (
-                "v1",
-                r"^v_.*_v1(?!\d)(?:_1)?_[ma]$|^v1(?!\d)(?:_1)?_[ma]$",
-            ),  # v_ta31_v1_1_m, v_ta31_v1_m, v1_1_m, v1_m (phasor name ends with v1 or v1_1)
-            (
-                "v0",
-                r"^v_.*_v0(?!\d)(?:_1)?_[ma]$|^v0(?!\d)(?:_1)?_[ma]$",
-            ),  # v_ta31_v0_1_m, v_ta31_v0_m, v0_1_m, v0_m (phasor name ends with v0 or v0_1)
-            (
-                "v2",
-                r"^v_.*_v2(?!\d)(?:_1)?_[ma]$|^v2(?!\d)(?:_1)?_[ma]$",
-            ),  # v_ta31_v2_1_m, v_ta31_v2_m, v2_1_m, v2_m (phasor name ends with v2 or v2_1)
-        ]
-        current_phases = [
-            (
-                "ia",
-                r"^i_.*_ia1_[ma]$|^ia1_[ma]$",
-            ),  # i_ta31_ia1_m, ia1_m (phasor name ends with ia1)
-            (
-                "ib",
-                r"^i_.*_ib1_[ma]$|^ib1_[ma]$",
-            ),  # i_ta31_ib1_m, ib1_m (phasor name ends with ib1)
-            (
-                "ic",
-                r"^i_.*_ic1_[ma]$|^ic1_[ma]$",
-            ),  # i_ta31_ic1_m, ic1_m (phasor name ends with ic1)
-            (
-                "i1",
-                r"^i_.*_i1(?!\d)(?:_1)?_[ma]$|^i1(?!\d)(?:_1)?_[ma]$",
-            ),  # i_ta31_i1_1_m, i_ta31_i1_m, i1_1_m, i1_m (phasor name ends with i1 or i1_1)
-            (
-                "i0",
-                r"^i_.*_i0(?!\d)(?:_1)?_[ma]$|^i0(?!\d)(?:_1)?_[ma]$",
-            ),  # i_ta31_i0_1_m, i_ta31_i0_m, i0_1_m, i0_m (phasor name ends with i0 or i0_1)
-            (
-                "i2",
-                r"^i_.*_i2(?!\d)(?:_1)?_[ma]$|^i2(?!\d)(?:_1)?_[ma]$",
-            ),  # i_ta31_i2_1_m, i_ta31_i2_m, i2_1_m, i2_m (phasor name ends with i2 or i2_1)
-        ]
-
-        voltage_magnitude = self._find_candidates_regex(df, voltage_phases, "_m")
-        voltage_angle = self._find_candidates_regex(df, voltage_phases, "_a")
-        current_magnitude = self._find_candidates_regex(df, current_phases, "_m")
-        current_angle = self._find_candidates_regex(df, current_phases, "_a")
+        # Detection depends only on the column names, so identically shaped frames
+        # share one cached result; copy it so callers can mutate their map freely.
+        cached = _detect_columns_cached(tuple(df.columns))
+        column_map = PhasorColumnMap(
+            voltage_magnitude=dict(cached.voltage_magnitude),
+            voltage_angle=dict(cached.voltage_angle),
+            current_magnitude=dict(cached.current_magnitude),
+            current_angle=dict(cached.current_angle),
+            frequency=list(cached.frequency),
+        )
 
         if self.logger:
-            self.logger.info("Frequency columns: %s", len(freq_cols))
+            self.logger.info("Frequency columns: %s", len(column_map.frequency))
             self.logger.info(
                 "Voltage magnitude columns found: %s",
-                dict(voltage_magnitude.items()),
+                dict(column_map.voltage_magnitude.items()),
             )
             self.logger.info(
                 "Current magnitude columns found: %s",
-                dict(current_magnitude.items()),
+                dict(column_map.current_magnitude.items()),
             )
 
-        return PhasorColumnMap(
-            voltage_magnitude=voltage_magnitude,
-            voltage_angle=voltage_angle,
-            current_magnitude=current_magnitude,
-            current_angle=current_angle,
-            frequency=freq_cols,
-        )
+        return column_map
 
     # -------------------------------------------------------------- Utilities --
     @staticmethod
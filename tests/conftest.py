@@ -5,16 +5,30 @@ This module provides common fixtures and test utilities that can be used
 across all test files in the suite.
 """
 
+import os
 import shutil
 import sys
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import NamedTuple, Optional
 from unittest.mock import MagicMock
 
 import numpy as np
 import pandas as pd
 import pytest
+import pytz
+
+
+class DateRangeArgs(NamedTuple):
+    """Slot-backed stand-in for the date range fields of a parsed CLI namespace."""
+
+    start: Optional[str] = None
+    end: Optional[str] = None
+    minutes: Optional[int] = None
+    hours: Optional[int] = None
+    days: Optional[int] = None
+
 
 # Mock pyodbc module to avoid native library dependency issues on macOS/Windows during testing
 # This must happen before any test imports phasor_point_cli modules
@@ -24,6 +38,36 @@ if "pyodbc" not in sys.modules:
     sys.modules["pyodbc"] = mock_pyodbc
 
 
+_FAST_SKIPPED_MARKERS = ("tzdata", "slow")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tzdata-backed and slow tests when FAST=1 is set for quick local feedback."""
+    if os.environ.get("FAST") != "1":
+        return
+    selected = []
+    deselected = []
+    for item in items:
+        if any(item.get_closest_marker(name) for name in _FAST_SKIPPED_MARKERS):
+            deselected.append(item)
+        else:
+            selected.append(item)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_timezones():
+    """
+    Load the timezones the suite relies on once, before any test body runs
+
+    pytz keeps loaded zones in its own module-level cache, so later lookups
+    (including those driven by the TZ environment variable) are dictionary hits.
+    """
+    return pytz.UTC, pytz.timezone("Europe/Copenhagen")
+
+
 @pytest.fixture
 def mock_db_connection(mocker):
     """
@@ -148,6 +192,48 @@ def sample_pmu_dataframe():
     return pd.DataFrame(data)
 
 
+@pytest.fixture(scope="session")
+def df_raw():
+    """
+    Provide a small raw extraction result shared across the session
+
+    Treat as read-only: it is built once and handed to mocks by many tests.
+
+    Returns:
+        pd.DataFrame: Four one-minute rows with ts and value columns
+    """
+    return pd.DataFrame(
+        {
+            "ts": pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq="min"),
+            "value": [1, 2, 3, 4],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def df_processed(df_raw):
+    """
+    Provide the processed counterpart of df_raw, shared across the session
+
+    Returns:
+        pd.DataFrame: Copy of df_raw (the processing step is mocked in tests)
+    """
+    return df_raw.copy()
+
+
+@pytest.fixture(scope="session")
+def df_small():
+    """
+    Provide a three-row frame shared across the session
+
+    Treat as read-only; copy it before handing it to code that may modify it.
+
+    Returns:
+        pd.DataFrame: Integer ts and value columns
+    """
+    return pd.DataFrame({"ts": [1, 2, 3], "value": [1, 2, 3]})
+
+
 @pytest.fixture
 def sample_pmu_dataframe_with_nulls():
     """
@@ -276,3 +362,19 @@ def sample_extraction_log():
         "issues_found": [],
         "statistics": {},
     }
+
+
+@pytest.fixture
+def make_args():
+    """
+    Provide a factory for date range argument namespaces
+
+    Usage:
+        def test_something(make_args):
+            args = make_args(minutes=60)
+
+    Returns:
+        type: DateRangeArgs, called with start/end/minutes/hours/days overrides;
+        every field defaults to None
+    """
+    return DateRangeArgs
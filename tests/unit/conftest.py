@@ -0,0 +1,176 @@
+"""
+Shared helpers and fixtures for unit tests
+
+Stubs here stand in for collaborators that several unit test modules need
+(config managers, config path managers, loggers, the extraction pipeline
+stages, extraction requests).
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from phasor_point_cli.models import DateRange, ExtractionRequest, PMUInfo
+
+
+class ConfigStub:
+    """Minimal config manager exposing ``config`` and ``get_pmu_info``."""
+
+    def __init__(self, data):
+        self.config = data
+
+    def get_pmu_info(self, pmu_id):
+        """Get PMU info from config."""
+        for pmu_data in self.config.get("available_pmus", []):
+            if pmu_data["id"] == pmu_id:
+                return PMUInfo(
+                    id=pmu_data["id"],
+                    station_name=pmu_data["station_name"],
+                    country=pmu_data.get("country", ""),
+                )
+        return None
+
+
+class MockConfigPathManager:
+    """Mock ConfigPathManager for testing."""
+
+    def __init__(self, temp_dir: Path):
+        self.temp_dir = temp_dir
+
+    def get_local_config_file(self) -> Path:
+        return self.temp_dir / "config.json"
+
+    def get_user_config_dir(self) -> Path:
+        return self.temp_dir
+
+
+class RecordingLogger:
+    """Logger sink that records every call as ``(method, args, kwargs)`` in ``calls``."""
+
+    def __init__(self):
+        self.calls = []
+
+    def debug(self, *args, **kwargs):
+        self.calls.append(("debug", args, kwargs))
+
+    def info(self, *args, **kwargs):
+        self.calls.append(("info", args, kwargs))
+
+    def warning(self, *args, **kwargs):
+        self.calls.append(("warning", args, kwargs))
+
+    def error(self, *args, **kwargs):
+        self.calls.append(("error", args, kwargs))
+
+    def __getattr__(self, name):
+        # Any other logger method is recorded the same way
+        return lambda *args, **kwargs: self.calls.append((name, args, kwargs))
+
+
+class FakeExtractor:
+    """
+    DataExtractor stand-in that records requests and returns ``df``
+
+    ``df`` may also be a callable taking the request, to vary the result per
+    call or to raise.
+    """
+
+    def __init__(self, df=None):
+        self.df = df
+        self.calls = []
+
+    def extract(self, request, *, chunk_strategy=None, progress_tracker=None):
+        self.calls.append(request)
+        return self.df(request) if callable(self.df) else self.df
+
+
+class FakeProcessor:
+    """DataProcessor stand-in that records input frames and returns ``(df, [])``."""
+
+    def __init__(self, df=None):
+        self.df = df
+        self.calls = []
+
+    def process(self, df, extraction_log=None, *, clean=True, validate=True):
+        self.calls.append(df)
+        return self.df, []
+
+
+class FakePowerCalculator:
+    """PowerCalculator stand-in that records input frames and returns ``(df, None)``."""
+
+    def __init__(self, df=None):
+        self.df = df
+        self.calls = []
+
+    def process_phasor_data(self, df, *, extraction_log=None):
+        self.calls.append(df)
+        return self.df, None
+
+
+@pytest.fixture
+def config_stub():
+    """
+    Provide the ConfigStub class
+
+    Usage:
+        def test_something(config_stub):
+            config_manager = config_stub({"available_pmus": [...]})
+    """
+    return ConfigStub
+
+
+@pytest.fixture
+def recording_logger():
+    """Provide a fresh RecordingLogger for the test."""
+    return RecordingLogger()
+
+
+@pytest.fixture
+def fake_extractor(df_small):
+    """Provide a FakeExtractor returning a private copy of df_small."""
+    return FakeExtractor(df_small.copy())
+
+
+@pytest.fixture
+def fake_processor(df_small):
+    """Provide a FakeProcessor returning a private copy of df_small."""
+    return FakeProcessor(df_small.copy())
+
+
+@pytest.fixture
+def fake_power_calculator(df_small):
+    """Provide a FakePowerCalculator returning a private copy of df_small."""
+    return FakePowerCalculator(df_small.copy())
+
+
+@pytest.fixture
+def config_path_manager(tmp_path):
+    """Create a config path manager rooted in the test's temporary directory."""
+    return MockConfigPathManager(tmp_path)
+
+
+@pytest.fixture
+def extraction_request(tmp_path):
+    """
+    Provide a ten-minute CSV extraction request for PMU 45012
+
+    Returns:
+        ExtractionRequest: Writes to ``tmp_path / "output.csv"``
+    """
+    date_range = DateRange(
+        start=datetime(2025, 1, 1, 0, 0, 0),
+        end=datetime(2025, 1, 1, 0, 10, 0),
+    )
+    return ExtractionRequest(
+        pmu_id=45012,
+        date_range=date_range,
+        output_file=tmp_path / "output.csv",
+        resolution=1,
+        processed=True,
+        clean=True,
+        chunk_size_minutes=15,
+        parallel_workers=1,
+        output_format="csv",
+    )
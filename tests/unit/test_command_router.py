@@ -7,122 +7,142 @@ handlers.
 
 import argparse
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from typing import NamedTuple, Optional
+from unittest.mock import MagicMock, Mock, create_autospec, patch
 
 import pytest
 
-from phasor_point_cli.command_router import CommandRouter
+from phasor_point_cli.cli import PhasorPointCLI
 from phasor_point_cli.constants import CLI_COMMAND_PYTHON
-from phasor_point_cli.models import ExtractionRequest, ExtractionResult, QueryResult
+from phasor_point_cli.models import ExtractionRequest, ExtractionResult, PMUInfo, QueryResult
 
+_TEST_PMU_INFO = PMUInfo(id=45012, station_name="Test PMU")
 
-class TestCommandRouter:
-    """Test suite for CommandRouter class."""
+# Spec'd CLI built once; methods such as update_connection_pool_size keep their signatures
+_CLI_TEMPLATE = create_autospec(PhasorPointCLI, instance=True)
 
-    @pytest.fixture
-    def mock_cli(self):
-        """Create a mock CLI instance."""
-        from phasor_point_cli.models import PMUInfo
+# Spec'd request placeholder shared by tests that only pass it through ExtractionResult
+_EXTRACTION_REQUEST_SPEC = create_autospec(ExtractionRequest, instance=True)
 
-        cli = Mock()
-        cli.connection_pool = Mock()
-        cli.connection_pool.max_connections = 3
 
-        # Create a mock config with get_pmu_info method
-        mock_config = Mock()
-        mock_config.get_pmu_info = Mock(return_value=PMUInfo(id=45012, station_name="Test PMU"))
-        cli.config = mock_config
-        cli.update_connection_pool_size = Mock()
-        return cli
+class _ExtractArgs(NamedTuple):
+    """Slot-backed stand-in for the parsed extract arguments (read via attribute access)."""
 
-    @pytest.fixture
-    def mock_logger(self):
-        """Create a mock logger."""
-        return Mock()
+    pmu: int = 45012
+    minutes: Optional[int] = 30
+    start: Optional[str] = None
+    end: Optional[str] = None
+    hours: Optional[int] = None
+    days: Optional[int] = None
+    resolution: int = 1
+    output: Optional[str] = None
+    processed: bool = True
+    raw: bool = False
+    no_clean: bool = False
+    chunk_size: int = 15
+    parallel: int = 2
+    format: str = "parquet"
+    connection_pool: int = 3
+    replace: bool = False
+    verbose_timing: bool = False
 
-    @pytest.fixture
-    def command_router(self, mock_cli, mock_logger):
-        """Create a CommandRouter instance."""
-        return CommandRouter(mock_cli, mock_logger, output=None)
 
-    def test_initialization(self, mock_cli, mock_logger):
-        """Test CommandRouter can be instantiated."""
-        # Arrange & Act
-        router = CommandRouter(mock_cli, mock_logger, output=None)
+_EXTRACT_TEMPLATE = _ExtractArgs()
 
-        # Assert
-        assert router is not None
-        assert router._cli == mock_cli
-        assert router._logger == mock_logger
 
-    def test_route_setup_command(self, command_router):
-        """Test routing to setup command handler."""
-        # Arrange
-        args = argparse.Namespace(command="setup", force=False)
+def _extract_args(**overrides):
+    """Build extract command arguments from the shared template."""
+    return _EXTRACT_TEMPLATE._replace(**overrides)
 
-        # Act
-        with patch.object(command_router, "handle_setup") as mock_handle:
-            command_router.route("setup", args)
 
-        # Assert
-        mock_handle.assert_called_once_with(args)
+def _wire_cli(cli):
+    """Install the baseline attributes the router reads from the CLI."""
+    # Instance attributes set in PhasorPointCLI.__init__ are not part of the class spec
+    cli.connection_pool = Mock(max_connections=3)
 
-    def test_route_list_tables_command(self, command_router):
-        """Test routing to list-tables command handler."""
-        # Arrange
-        args = argparse.Namespace(command="list-tables", pmu=None, max_pmus=10)
+    # Create a mock config with get_pmu_info method
+    mock_config = Mock()
+    mock_config.get_pmu_info = Mock(return_value=_TEST_PMU_INFO)
+    cli.config = mock_config
 
-        # Act
-        with patch.object(command_router, "handle_list_tables") as mock_handle:
-            command_router.route("list-tables", args)
 
-        # Assert
-        mock_handle.assert_called_once_with(args)
+def _stub(obj, name):
+    """Shadow ``obj.name`` with a fresh Mock on the instance and return it."""
+    mock = Mock()
+    setattr(obj, name, mock)
+    return mock
 
-    def test_route_table_info_command(self, command_router):
-        """Test routing to table-info command handler."""
-        # Arrange
-        args = argparse.Namespace(command="table-info", pmu=45012, resolution=1)
 
-        # Act
-        with patch.object(command_router, "handle_table_info") as mock_handle:
-            command_router.route("table-info", args)
-
-        # Assert
-        mock_handle.assert_called_once_with(args)
+class TestCommandRouter:
+    """Test suite for CommandRouter class."""
 
-    def test_route_extract_command(self, command_router):
-        """Test routing to extract command handler."""
-        # Arrange
-        args = argparse.Namespace(command="extract", pmu=45012)
+    @pytest.fixture(scope="module")
+    def mock_cli(self):
+        """Return the module-wide autospec'd CLI with baseline wiring."""
+        _CLI_TEMPLATE.reset_mock()
+        _wire_cli(_CLI_TEMPLATE)
+        return _CLI_TEMPLATE
 
-        # Act
-        with patch.object(command_router, "handle_extract") as mock_handle:
-            command_router.route("extract", args)
+    @pytest.fixture(scope="module")
+    def mock_logger(self):
+        """Create a mock logger shared across the module."""
+        return Mock()
 
-        # Assert
-        mock_handle.assert_called_once_with(args)
+    @pytest.fixture(autouse=True)
+    def _reset(self, mock_cli, mock_logger):
+        """Clear recorded calls and undo per-test rewiring of the shared mocks."""
+        yield
+        mock_cli.reset_mock()
+        mock_logger.reset_mock()
+        _wire_cli(mock_cli)
 
-    def test_route_batch_extract_command(self, command_router):
-        """Test routing to batch-extract command handler."""
-        # Arrange
-        args = argparse.Namespace(command="batch-extract", pmus="45012,45013")
+    @pytest.fixture
+    def command_router(self, mock_cli, mock_logger):
+        """Create a CommandRouter instance."""
+        from phasor_point_cli.command_router import CommandRouter
 
-        # Act
-        with patch.object(command_router, "handle_batch_extract") as mock_handle:
-            command_router.route("batch-extract", args)
+        return CommandRouter(mock_cli, mock_logger, output=None)
 
+    @pytest.fixture(autouse=True)
+    def patched_managers(self, monkeypatch):
+        """Replace the manager classes used by the router with MagicMocks for every test."""
+        mocks = {}
+        for name in ("TableManager", "ExtractionManager", "QueryExecutor"):
+            mock = MagicMock()
+            monkeypatch.setattr(f"phasor_point_cli.command_router.{name}", mock)
+            mocks[name] = mock
+        return mocks
+
+    def test_initialization(self, command_router, mock_cli, mock_logger):
+        """Test CommandRouter can be instantiated."""
         # Assert
-        mock_handle.assert_called_once_with(args)
-
-    def test_route_query_command(self, command_router):
-        """Test routing to query command handler."""
+        assert command_router is not None
+        assert command_router._cli == mock_cli
+        assert command_router._logger == mock_logger
+
+    @pytest.mark.parametrize(
+        ("cmd", "handler", "kwargs"),
+        [
+            ("setup", "handle_setup", {"force": False}),
+            ("list-tables", "handle_list_tables", {"pmu": None, "max_pmus": 10}),
+            ("table-info", "handle_table_info", {"pmu": 45012, "resolution": 1}),
+            ("extract", "handle_extract", {"pmu": 45012}),
+            ("batch-extract", "handle_batch_extract", {"pmus": "45012,45013"}),
+            ("query", "handle_query", {"sql": "SELECT * FROM pmu_45012_1"}),
+            ("config", "handle_config", {"clean": False}),
+            ("about", "handle_about", {}),
+        ],
+    )
+    def test_route_dispatch(self, command_router, cmd, handler, kwargs):
+        """Test routing each command to its handler."""
         # Arrange
-        args = argparse.Namespace(command="query", sql="SELECT * FROM pmu_45012_1")
+        args = argparse.Namespace(command=cmd, **kwargs)
+
+        mock_handle = _stub(command_router, handler)
 
         # Act
-        with patch.object(command_router, "handle_query") as mock_handle:
-            command_router.route("query", args)
+        command_router.route(cmd, args)
 
         # Assert
         mock_handle.assert_called_once_with(args)
@@ -136,66 +156,23 @@ class TestCommandRouter:
         with pytest.raises(ValueError, match="Unknown command: unknown"):
             command_router.route("unknown", args)
 
-    def test_handle_setup_without_force(self, command_router):
-        """Test handle_setup without force flag (interactive by default)."""
-        # Arrange
-        args = argparse.Namespace(force=False, interactive=True)
-
-        # Act
-        with patch(
-            "phasor_point_cli.command_router.ConfigurationManager.setup_configuration_files"
-        ) as mock_setup:
-            command_router.handle_setup(args)
-
-        # Assert
-        mock_setup.assert_called_once_with(force=False, local=False, interactive=True)
-
-    def test_handle_setup_with_force(self, command_router):
-        """Test handle_setup with force flag."""
-        # Arrange
-        args = argparse.Namespace(force=True, interactive=True)
-
-        # Act
-        with patch(
-            "phasor_point_cli.command_router.ConfigurationManager.setup_configuration_files"
-        ) as mock_setup:
-            command_router.handle_setup(args)
-
-        # Assert
-        mock_setup.assert_called_once_with(force=True, local=False, interactive=True)
-
-    def test_handle_setup_with_local(self, command_router):
-        """Test handle_setup with local flag."""
-        # Arrange
-        args = argparse.Namespace(force=False, local=True, interactive=True)
-
-        # Act
-        with patch(
-            "phasor_point_cli.command_router.ConfigurationManager.setup_configuration_files"
-        ) as mock_setup:
-            command_router.handle_setup(args)
-
-        # Assert
-        mock_setup.assert_called_once_with(force=False, local=True, interactive=True)
-
-    def test_handle_setup_with_force_and_local(self, command_router):
-        """Test handle_setup with both force and local flags."""
-        # Arrange
-        args = argparse.Namespace(force=True, local=True, interactive=True)
-
-        # Act
-        with patch(
-            "phasor_point_cli.command_router.ConfigurationManager.setup_configuration_files"
-        ) as mock_setup:
-            command_router.handle_setup(args)
-
-        # Assert
-        mock_setup.assert_called_once_with(force=True, local=True, interactive=True)
-
-    def test_handle_setup_with_interactive(self, command_router):
-        """Test handle_setup with interactive flag (explicitly set)."""
+    @pytest.mark.parametrize(
+        "flags",
+        [
+            {"force": False, "interactive": True},
+            {"force": True, "interactive": True},
+            {"force": False, "local": True, "interactive": True},
+            {"force": True, "local": True, "interactive": True},
+            {"force": False, "local": False, "interactive": True},
+            {"force": False, "local": False, "interactive": False},
+        ],
+        ids=["default", "force", "local", "force_and_local", "interactive", "no_interactive"],
+    )
+    def test_handle_setup(self, command_router, flags):
+        """Test handle_setup forwards the setup flags (local defaults to False)."""
         # Arrange
-        args = argparse.Namespace(force=False, local=False, interactive=True)
+        args = argparse.Namespace(**flags)
+        expected = {"force": False, "local": False, "interactive": True, **flags}
 
         # Act
         with patch(
@@ -204,33 +181,18 @@ class TestCommandRouter:
             command_router.handle_setup(args)
 
         # Assert
-        mock_setup.assert_called_once_with(force=False, local=False, interactive=True)
-
-    def test_handle_setup_with_no_interactive(self, command_router):
-        """Test handle_setup with --no-interactive flag."""
-        # Arrange
-        args = argparse.Namespace(force=False, local=False, interactive=False)
+        mock_setup.assert_called_once_with(**expected)
 
-        # Act
-        with patch(
-            "phasor_point_cli.command_router.ConfigurationManager.setup_configuration_files"
-        ) as mock_setup:
-            command_router.handle_setup(args)
-
-        # Assert
-        mock_setup.assert_called_once_with(force=False, local=False, interactive=False)
-
-    def test_handle_list_tables_default(self, command_router):
+    def test_handle_list_tables_default(self, command_router, patched_managers):
         """Test handle_list_tables with default parameters."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=False)
-        mock_result = Mock(found_pmus={45012: [1]}, total_tables=1)
+        mock_result = SimpleNamespace(found_pmus={45012: [1]}, total_tables=1)
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         mock_manager.list_available_tables.assert_called_once()
@@ -238,155 +200,96 @@ class TestCommandRouter:
         assert call_kwargs["pmu_ids"] is None
         assert call_kwargs["max_pmus"] == 10
 
-    def test_handle_list_tables_with_pmu_ids(self, command_router):
+    def test_handle_list_tables_with_pmu_ids(self, command_router, patched_managers):
         """Test handle_list_tables with specific PMU numbers."""
         # Arrange
         args = argparse.Namespace(pmu=[45012, 45013], max_pmus=10, all=False)
-        mock_result = Mock(found_pmus={45012: [1], 45013: [1]}, total_tables=2)
+        mock_result = SimpleNamespace(found_pmus={45012: [1], 45013: [1]}, total_tables=2)
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         mock_manager.list_available_tables.assert_called_once()
         call_kwargs = mock_manager.list_available_tables.call_args[1]
         assert call_kwargs["pmu_ids"] == [45012, 45013]
 
-    def test_handle_list_tables_with_all_flag(self, command_router):
+    def test_handle_list_tables_with_all_flag(self, command_router, patched_managers):
         """Test handle_list_tables with --all flag."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=True)
-        mock_result = Mock(found_pmus={45012: [1]}, total_tables=1)
+        mock_result = SimpleNamespace(found_pmus={45012: [1]}, total_tables=1)
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         mock_manager.list_available_tables.assert_called_once()
         call_kwargs = mock_manager.list_available_tables.call_args[1]
         assert call_kwargs["max_pmus"] is None
 
-    def test_handle_table_info(self, command_router):
+    def test_handle_table_info(self, command_router, patched_managers):
         """Test handle_table_info."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
-        from phasor_point_cli.models import PMUInfo, TableInfo, TableStatistics
+        from phasor_point_cli.models import TableInfo, TableStatistics
 
-        mock_pmu_info = PMUInfo(id=45012, station_name="Test PMU")
         mock_stats = TableStatistics(row_count=1000, column_count=10)
         mock_table_info = TableInfo(
             pmu_id=45012,
             resolution=1,
             table_name="pmu_45012_1",
             statistics=mock_stats,
-            pmu_info=mock_pmu_info,
+            pmu_info=_TEST_PMU_INFO,
             sample_data=None,
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = mock_table_info
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = mock_table_info
+        command_router.handle_table_info(args)
 
         # Assert
         mock_manager.get_table_info.assert_called_once_with(45012, 1)
 
-    def test_handle_extract_with_minutes(self, command_router, mock_cli):
-        """Test handle_extract with minutes duration."""
+    @pytest.mark.parametrize(
+        ("success", "error", "log_method"),
+        [(True, None, "info"), (False, "Database connection failed", "error")],
+        ids=["success", "error"],
+    )
+    def test_handle_extract(self, command_router, patched_managers, success, error, log_method):
+        """Test handle_extract logs the extraction outcome."""
         # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-        )
-
-        # Create a mock request
-        mock_request = Mock(spec=ExtractionRequest)
+        args = _extract_args()
 
         mock_result = ExtractionResult(
-            request=mock_request,
-            success=True,
-            output_file=Path("test.parquet"),
-            rows_extracted=100,
-            extraction_time_seconds=10.0,
+            request=_EXTRACTION_REQUEST_SPEC,
+            success=success,
+            output_file=Path("test.parquet") if success else None,
+            rows_extracted=100 if success else 0,
+            extraction_time_seconds=10.0 if success else 0,
+            error=error,
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
         # Assert
         mock_manager_class.assert_called_once()
         mock_manager.extract.assert_called_once()
-        command_router._logger.info.assert_called_once()
-
-    def test_handle_extract_with_error(self, command_router, mock_cli):
-        """Test handle_extract with extraction error."""
-        # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-        )
-
-        # Create a mock request
-        mock_request = Mock(spec=ExtractionRequest)
-
-        mock_result = ExtractionResult(
-            request=mock_request,
-            success=False,
-            output_file=None,
-            rows_extracted=0,
-            extraction_time_seconds=0,
-            error="Database connection failed",
-        )
-
-        # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
-
-            command_router.handle_extract(args)
-
-        # Assert
-        command_router._logger.error.assert_called_once()
-        assert "Database connection failed" in str(command_router._logger.error.call_args)
+        log_call = getattr(command_router._logger, log_method)
+        log_call.assert_called_once()
+        if error:
+            assert error in str(log_call.call_args)
 
     def test_handle_extract_with_invalid_date_range(self, command_router):
         """Test handle_extract with invalid date range."""
@@ -408,29 +311,15 @@ class TestCommandRouter:
         # Assert
         command_router._logger.error.assert_called_once()
 
-    def test_handle_extract_with_raw_flag_disables_clean(self, command_router, mock_cli):
+    def test_handle_extract_with_raw_flag_disables_clean(
+        self, command_router, patched_managers, mock_cli
+    ):
         """Test that --raw flag disables both processing and cleaning."""
         # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=True,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-        )
+        args = _extract_args(raw=True)
 
         mock_result = ExtractionResult(
-            request=Mock(spec=ExtractionRequest),
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -438,21 +327,21 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
-            # Get the ExtractionRequest that was created
-            actual_request_call = mock_manager.extract.call_args[0][0]
+        # Get the ExtractionRequest that was created
+        actual_request_call = mock_manager.extract.call_args[0][0]
 
         # Assert
         assert actual_request_call.processed is False, "--raw should disable processing"
         assert actual_request_call.clean is False, "--raw should disable cleaning"
 
-    def test_handle_batch_extract(self, command_router):
+    def test_handle_batch_extract(self, command_router, patched_managers):
         """Test handle_batch_extract."""
         # Arrange
         args = argparse.Namespace(
@@ -477,10 +366,9 @@ class TestCommandRouter:
         mock_batch_result = BatchExtractionResult(batch_id="test-batch-123", results=[])
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as MockEM:
-            mock_manager = MockEM.return_value
-            mock_manager.batch_extract.return_value = mock_batch_result
-            command_router.handle_batch_extract(args)
+        mock_manager = patched_managers["ExtractionManager"].return_value
+        mock_manager.batch_extract.return_value = mock_batch_result
+        command_router.handle_batch_extract(args)
 
         # Assert
         mock_manager.batch_extract.assert_called_once()
@@ -504,7 +392,7 @@ class TestCommandRouter:
         # Assert
         command_router._logger.error.assert_called_once()
 
-    def test_handle_query_success(self, command_router):
+    def test_handle_query_success(self, command_router, patched_managers):
         """Test handle_query with successful execution."""
         # Arrange
         args = argparse.Namespace(
@@ -519,12 +407,12 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.QueryExecutor") as mock_executor_class:
-            mock_executor = Mock()
-            mock_executor.execute.return_value = mock_result
-            mock_executor_class.return_value = mock_executor
+        mock_executor_class = patched_managers["QueryExecutor"]
+        mock_executor = Mock()
+        mock_executor.execute.return_value = mock_result
+        mock_executor_class.return_value = mock_executor
 
-            command_router.handle_query(args)
+        command_router.handle_query(args)
 
         # Assert
         mock_executor.execute.assert_called_once_with(
@@ -532,7 +420,7 @@ class TestCommandRouter:
         )
         command_router._logger.error.assert_not_called()
 
-    def test_handle_query_failure(self, command_router):
+    def test_handle_query_failure(self, command_router, patched_managers):
         """Test handle_query with execution failure."""
         # Arrange
         args = argparse.Namespace(sql="SELECT * FROM invalid_table", output=None, format="parquet")
@@ -546,43 +434,26 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.QueryExecutor") as mock_executor_class:
-            mock_executor = Mock()
-            mock_executor.execute.return_value = mock_result
-            mock_executor_class.return_value = mock_executor
+        mock_executor_class = patched_managers["QueryExecutor"]
+        mock_executor = Mock()
+        mock_executor.execute.return_value = mock_result
+        mock_executor_class.return_value = mock_executor
 
-            command_router.handle_query(args)
+        command_router.handle_query(args)
 
         # Assert
         command_router._logger.error.assert_called_once()
         assert "Table not found" in str(command_router._logger.error.call_args)
 
-    def test_handle_extract_updates_connection_pool_size(self, command_router, mock_cli):
+    def test_handle_extract_updates_connection_pool_size(
+        self, command_router, patched_managers, mock_cli
+    ):
         """Test handle_extract updates connection pool size when needed."""
         # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=5,  # Different from default
-        )
-
-        # Create a mock request
-        mock_request = Mock(spec=ExtractionRequest)
+        args = _extract_args(connection_pool=5)  # Different from default
 
         mock_result = ExtractionResult(
-            request=mock_request,
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -590,42 +461,28 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
         # Assert
         mock_cli.update_connection_pool_size.assert_called_once_with(5)
 
-    def test_handle_extract_with_pmu_not_in_config(self, command_router, mock_cli, capsys):
+    def test_handle_extract_with_pmu_not_in_config(
+        self, command_router, patched_managers, mock_cli, capsys
+    ):
         """Test handle_extract with PMU not found in configuration."""
         # Arrange
         mock_cli.config.get_pmu_info = Mock(return_value=None)
         mock_cli.config.get_all_pmu_ids = Mock(return_value=[45020, 45021])
 
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-        )
+        args = _extract_args()
 
         mock_result = ExtractionResult(
-            request=Mock(spec=ExtractionRequest),
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -633,12 +490,12 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
         # Assert
         captured = capsys.readouterr()
@@ -647,33 +504,17 @@ class TestCommandRouter:
         command_router._logger.warning.assert_called_once()
 
     def test_handle_extract_with_pmu_not_in_config_empty_config(
-        self, command_router, mock_cli, capsys
+        self, command_router, patched_managers, mock_cli, capsys
     ):
         """Test handle_extract with PMU not found and empty configuration."""
         # Arrange
         mock_cli.config.get_pmu_info = Mock(return_value=None)
         mock_cli.config.get_all_pmu_ids = Mock(return_value=[])
 
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-        )
+        args = _extract_args()
 
         mock_result = ExtractionResult(
-            request=Mock(spec=ExtractionRequest),
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -681,12 +522,12 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
         # Assert
         captured = capsys.readouterr()
@@ -808,42 +649,19 @@ class TestCommandRouter:
         # Assert
         mock_print_about.assert_called_once()
 
-    def test_route_config_command(self, command_router):
-        """Test routing to config command handler."""
-        # Arrange
-        args = argparse.Namespace(command="config", clean=False)
-
-        # Act
-        with patch.object(command_router, "handle_config") as mock_handle:
-            command_router.route("config", args)
-
-        # Assert
-        mock_handle.assert_called_once_with(args)
-
-    def test_route_about_command(self, command_router):
-        """Test routing to about command handler."""
-        # Arrange
-        args = argparse.Namespace(command="about")
-
-        # Act
-        with patch.object(command_router, "handle_about") as mock_handle:
-            command_router.route("about", args)
-
-        # Assert
-        mock_handle.assert_called_once_with(args)
-
-    def test_handle_list_tables_no_tables_found(self, command_router, mock_cli, capsys):
+    def test_handle_list_tables_no_tables_found(
+        self, command_router, patched_managers, mock_cli, capsys
+    ):
         """Test handle_list_tables when no tables are found."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=False)
-        mock_result = Mock(found_pmus={}, total_tables=0)
+        mock_result = SimpleNamespace(found_pmus={}, total_tables=0)
         mock_cli.config.get_all_pmu_ids = Mock(return_value=[45012, 45013])
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         command_router._logger.error.assert_called_once()
@@ -852,19 +670,18 @@ class TestCommandRouter:
         assert "Configuration contains 2 PMU(s)" in captured.out
 
     def test_handle_list_tables_no_tables_found_empty_config(
-        self, command_router, mock_cli, capsys
+        self, command_router, patched_managers, mock_cli, capsys
     ):
         """Test handle_list_tables when no tables found and config is empty."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=False)
-        mock_result = Mock(found_pmus={}, total_tables=0)
+        mock_result = SimpleNamespace(found_pmus={}, total_tables=0)
         mock_cli.config.get_all_pmu_ids = Mock(return_value=[])
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         captured = capsys.readouterr()
@@ -872,50 +689,49 @@ class TestCommandRouter:
         assert "PMU metadata not loaded in configuration (0 PMUs in config)" in captured.out
         assert f"{CLI_COMMAND_PYTHON} config --refresh-pmus" in captured.out
 
-    def test_handle_list_tables_with_unknown_pmus(self, command_router, mock_cli, capsys):
+    def test_handle_list_tables_with_unknown_pmus(
+        self, command_router, patched_managers, mock_cli, capsys
+    ):
         """Test handle_list_tables displays warning for unknown PMUs."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=False)
-        mock_result = Mock(found_pmus={45012: [1], 45999: [1]}, total_tables=2)
+        mock_result = SimpleNamespace(found_pmus={45012: [1], 45999: [1]}, total_tables=2)
         mock_cli.config.get_pmu_info = Mock(
-            side_effect=lambda pmu_id: None
-            if pmu_id == 45999
-            else Mock(station_name="Test PMU", country="US")
+            side_effect=lambda pmu_id: (
+                None if pmu_id == 45999 else Mock(station_name="Test PMU", country="US")
+            )
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.return_value = mock_result
-            command_router.handle_list_tables(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.return_value = mock_result
+        command_router.handle_list_tables(args)
 
         # Assert
         captured = capsys.readouterr()
         assert "show as 'Unknown' - metadata not in configuration" in captured.out
 
-    def test_handle_list_tables_exception_handling(self, command_router):
+    def test_handle_list_tables_exception_handling(self, command_router, patched_managers):
         """Test handle_list_tables stops progress tracker on exception."""
         # Arrange
         args = argparse.Namespace(pmu=None, max_pmus=10, all=False)
 
         # Act & Assert
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.list_available_tables.side_effect = Exception("Database error")
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.list_available_tables.side_effect = Exception("Database error")
 
-            with pytest.raises(Exception, match="Database error"):
-                command_router.handle_list_tables(args)
+        with pytest.raises(Exception, match="Database error"):
+            command_router.handle_list_tables(args)
 
-    def test_handle_table_info_not_found(self, command_router, capsys):
+    def test_handle_table_info_not_found(self, command_router, patched_managers, capsys):
         """Test handle_table_info when table is not found."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = None
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = None
+        command_router.handle_table_info(args)
 
         # Assert
         command_router._logger.error.assert_called_once()
@@ -923,11 +739,11 @@ class TestCommandRouter:
         assert "[ERROR] Table pmu_45012_1 not found or not accessible" in captured.out
         assert f"{CLI_COMMAND_PYTHON} config --refresh-pmus" in captured.out
 
-    def test_handle_table_info_with_country(self, command_router, capsys):
+    def test_handle_table_info_with_country(self, command_router, patched_managers, capsys):
         """Test handle_table_info displays country information."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
-        from phasor_point_cli.models import PMUInfo, TableInfo, TableStatistics
+        from phasor_point_cli.models import TableInfo, TableStatistics
 
         mock_pmu_info = PMUInfo(id=45012, station_name="Test PMU", country="USA")
         mock_stats = TableStatistics(row_count=1000, column_count=10)
@@ -941,16 +757,17 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = mock_table_info
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = mock_table_info
+        command_router.handle_table_info(args)
 
         # Assert
         captured = capsys.readouterr()
         assert "[PMU] 45012 - Test PMU (USA)" in captured.out
 
-    def test_handle_batch_extract_with_missing_pmus(self, command_router, mock_cli, capsys):
+    def test_handle_batch_extract_with_missing_pmus(
+        self, command_router, patched_managers, mock_cli, capsys
+    ):
         """Test handle_batch_extract with some PMUs not in config."""
         # Arrange
         mock_cli.config.get_pmu_info = Mock(
@@ -980,10 +797,9 @@ class TestCommandRouter:
         mock_batch_result = BatchExtractionResult(batch_id="test-batch-123", results=[])
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as MockEM:
-            mock_manager = MockEM.return_value
-            mock_manager.batch_extract.return_value = mock_batch_result
-            command_router.handle_batch_extract(args)
+        mock_manager = patched_managers["ExtractionManager"].return_value
+        mock_manager.batch_extract.return_value = mock_batch_result
+        command_router.handle_batch_extract(args)
 
         # Assert
         captured = capsys.readouterr()
@@ -1016,7 +832,9 @@ class TestCommandRouter:
         assert "No PMUs loaded in configuration" in captured.out
         assert f"{CLI_COMMAND_PYTHON} config --refresh-pmus" in captured.out
 
-    def test_handle_batch_extract_updates_connection_pool(self, command_router, mock_cli):
+    def test_handle_batch_extract_updates_connection_pool(
+        self, command_router, patched_managers, mock_cli
+    ):
         """Test handle_batch_extract updates connection pool size when needed."""
         # Arrange
         args = argparse.Namespace(
@@ -1041,38 +859,20 @@ class TestCommandRouter:
         mock_batch_result = BatchExtractionResult(batch_id="test-batch-123", results=[])
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as MockEM:
-            mock_manager = MockEM.return_value
-            mock_manager.batch_extract.return_value = mock_batch_result
-            command_router.handle_batch_extract(args)
+        mock_manager = patched_managers["ExtractionManager"].return_value
+        mock_manager.batch_extract.return_value = mock_batch_result
+        command_router.handle_batch_extract(args)
 
         # Assert
         mock_cli.update_connection_pool_size.assert_called_once_with(8)
 
-    def test_handle_extract_with_verbose_timing(self, command_router, mock_cli):
+    def test_handle_extract_with_verbose_timing(self, command_router, patched_managers, mock_cli):
         """Test handle_extract passes verbose_timing parameter."""
         # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-            verbose_timing=True,
-        )
+        args = _extract_args(verbose_timing=True)
 
         mock_result = ExtractionResult(
-            request=Mock(spec=ExtractionRequest),
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -1080,18 +880,18 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
         # Assert
         call_kwargs = mock_manager_class.call_args[1]
         assert call_kwargs["verbose_timing"] is True
 
-    def test_handle_batch_extract_with_verbose_timing(self, command_router):
+    def test_handle_batch_extract_with_verbose_timing(self, command_router, patched_managers):
         """Test handle_batch_extract passes verbose_timing parameter."""
         # Arrange
         args = argparse.Namespace(
@@ -1117,39 +917,21 @@ class TestCommandRouter:
         mock_batch_result = BatchExtractionResult(batch_id="test-batch-123", results=[])
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as MockEM:
-            mock_manager = MockEM.return_value
-            mock_manager.batch_extract.return_value = mock_batch_result
-            command_router.handle_batch_extract(args)
+        mock_manager = patched_managers["ExtractionManager"].return_value
+        mock_manager.batch_extract.return_value = mock_batch_result
+        command_router.handle_batch_extract(args)
 
         # Assert
-        call_kwargs = MockEM.call_args[1]
+        call_kwargs = patched_managers["ExtractionManager"].call_args[1]
         assert call_kwargs["verbose_timing"] is True
 
-    def test_handle_extract_with_replace_flag(self, command_router, mock_cli):
+    def test_handle_extract_with_replace_flag(self, command_router, patched_managers, mock_cli):
         """Test handle_extract passes replace parameter."""
         # Arrange
-        args = argparse.Namespace(
-            pmu=45012,
-            minutes=30,
-            start=None,
-            end=None,
-            hours=None,
-            days=None,
-            resolution=1,
-            output=None,
-            processed=True,
-            raw=False,
-            no_clean=False,
-            chunk_size=15,
-            parallel=2,
-            format="parquet",
-            connection_pool=3,
-            replace=True,
-        )
+        args = _extract_args(replace=True)
 
         mock_result = ExtractionResult(
-            request=Mock(spec=ExtractionRequest),
+            request=_EXTRACTION_REQUEST_SPEC,
             success=True,
             output_file=Path("test.parquet"),
             rows_extracted=100,
@@ -1157,15 +939,15 @@ class TestCommandRouter:
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.ExtractionManager") as mock_manager_class:
-            mock_manager = Mock()
-            mock_manager.extract.return_value = mock_result
-            mock_manager_class.return_value = mock_manager
+        mock_manager_class = patched_managers["ExtractionManager"]
+        mock_manager = Mock()
+        mock_manager.extract.return_value = mock_result
+        mock_manager_class.return_value = mock_manager
 
-            command_router.handle_extract(args)
+        command_router.handle_extract(args)
 
-            # Get the ExtractionRequest that was created
-            actual_request_call = mock_manager.extract.call_args[0][0]
+        # Get the ExtractionRequest that was created
+        actual_request_call = mock_manager.extract.call_args[0][0]
 
         # Assert
         assert actual_request_call.replace is True
@@ -1185,15 +967,14 @@ class TestCommandRouter:
         # Assert
         tracker.update.assert_called_once_with(50, 100, 5)
 
-    def test_handle_table_info_with_time_range(self, command_router, capsys):
+    def test_handle_table_info_with_time_range(self, command_router, patched_managers, capsys):
         """Test handle_table_info displays time range."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
         from datetime import datetime
 
-        from phasor_point_cli.models import PMUInfo, TableInfo, TableStatistics
+        from phasor_point_cli.models import TableInfo, TableStatistics
 
-        mock_pmu_info = PMUInfo(id=45012, station_name="Test PMU")
         mock_stats = TableStatistics(
             row_count=1000,
             column_count=10,
@@ -1205,29 +986,27 @@ class TestCommandRouter:
             resolution=1,
             table_name="pmu_45012_1",
             statistics=mock_stats,
-            pmu_info=mock_pmu_info,
+            pmu_info=_TEST_PMU_INFO,
             sample_data=None,
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = mock_table_info
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = mock_table_info
+        command_router.handle_table_info(args)
 
         # Assert
         captured = capsys.readouterr()
         assert "Time range:" in captured.out
 
-    def test_handle_table_info_with_start_time_only(self, command_router, capsys):
+    def test_handle_table_info_with_start_time_only(self, command_router, patched_managers, capsys):
         """Test handle_table_info displays only start time when end time is None."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
         from datetime import datetime
 
-        from phasor_point_cli.models import PMUInfo, TableInfo, TableStatistics
+        from phasor_point_cli.models import TableInfo, TableStatistics
 
-        mock_pmu_info = PMUInfo(id=45012, station_name="Test PMU")
         mock_stats = TableStatistics(
             row_count=1000,
             column_count=10,
@@ -1239,22 +1018,21 @@ class TestCommandRouter:
             resolution=1,
             table_name="pmu_45012_1",
             statistics=mock_stats,
-            pmu_info=mock_pmu_info,
+            pmu_info=_TEST_PMU_INFO,
             sample_data=None,
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = mock_table_info
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = mock_table_info
+        command_router.handle_table_info(args)
 
         # Assert
         captured = capsys.readouterr()
         assert "Earliest timestamp:" in captured.out
         assert "Last day:" in captured.out
 
-    def test_handle_table_info_with_sample_data(self, command_router, capsys):
+    def test_handle_table_info_with_sample_data(self, command_router, patched_managers, capsys):
         """Test handle_table_info displays sample data."""
         # Arrange
         args = argparse.Namespace(pmu=45012, resolution=1)
@@ -1262,9 +1040,8 @@ class TestCommandRouter:
 
         import pandas as pd
 
-        from phasor_point_cli.models import PMUInfo, TableInfo, TableStatistics
+        from phasor_point_cli.models import TableInfo, TableStatistics
 
-        mock_pmu_info = PMUInfo(id=45012, station_name="Test PMU")
         mock_stats = TableStatistics(
             row_count=1000,
             column_count=3,
@@ -1277,15 +1054,14 @@ class TestCommandRouter:
             resolution=1,
             table_name="pmu_45012_1",
             statistics=mock_stats,
-            pmu_info=mock_pmu_info,
+            pmu_info=_TEST_PMU_INFO,
             sample_data=sample_df,
         )
 
         # Act
-        with patch("phasor_point_cli.command_router.TableManager") as MockTableManager:
-            mock_manager = MockTableManager.return_value
-            mock_manager.get_table_info.return_value = mock_table_info
-            command_router.handle_table_info(args)
+        mock_manager = patched_managers["TableManager"].return_value
+        mock_manager.get_table_info.return_value = mock_table_info
+        command_router.handle_table_info(args)
 
         # Assert
         captured = capsys.readouterr()
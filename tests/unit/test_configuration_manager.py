@@ -5,70 +5,88 @@ Unit tests for the ConfigurationManager class.
 from __future__ import annotations
 
 import json
+from pathlib import Path
 
 import pytest
 
 from phasor_point_cli.config import ConfigurationManager
 from phasor_point_cli.constants import CLI_COMMAND_PYTHON
 
+_PAYLOAD = {
+    "database": {"driver": "Custom Driver"},
+    "extraction": {"default_resolution": 5},
+    "data_quality": {
+        "frequency_min": 49,
+        "frequency_max": 51,
+        "null_threshold_percent": 20,
+        "gap_multiplier": 2,
+    },
+    "output": {"default_output_dir": "data"},
+    "available_pmus": [{"id": 45012, "station_name": "Test PMU", "country": "FI"}],
+}
+_PAYLOAD_JSON = json.dumps(_PAYLOAD)
 
-def test_configuration_manager_uses_embedded_defaults():
-    # Arrange
-    manager = ConfigurationManager()
 
+@pytest.fixture(scope="module")
+def shared_config(tmp_path_factory):
+    """Config file written once per module; copy it before mutating."""
+    config_file = tmp_path_factory.mktemp("cfg") / "config.json"
+    config_file.write_text(_PAYLOAD_JSON, encoding="utf-8")
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def default_manager():
+    """ConfigurationManager built from embedded defaults, shared by read-only tests."""
+    return ConfigurationManager()
+
+
+def test_configuration_manager_uses_embedded_defaults(default_manager):
     # Act
-    database = manager.get_database_config()
-    extraction = manager.get_extraction_config()
+    database = default_manager.get_database_config()
+    extraction = default_manager.get_extraction_config()
 
     # Assert
     assert database["driver"] == "Psymetrix PhasorPoint"
     assert extraction["default_resolution"] == 50
     # Embedded defaults now have empty PMU list (populated dynamically during setup)
-    assert len(manager.get_all_pmu_ids()) == 0
+    assert len(default_manager.get_all_pmu_ids()) == 0
 
 
-def test_configuration_manager_loads_from_file(tmp_path):
+def test_default_managers_do_not_leak_mutations():
     # Arrange
-    config_file = tmp_path / "config.json"
-    payload = {
-        "database": {"driver": "Custom Driver"},
-        "extraction": {"default_resolution": 5},
-        "data_quality": {
-            "frequency_min": 49,
-            "frequency_max": 51,
-            "null_threshold_percent": 20,
-            "gap_multiplier": 2,
-        },
-        "output": {"default_output_dir": "data"},
-        "available_pmus": [{"id": 45012, "station_name": "Test PMU", "country": "FI"}],
-    }
-    config_file.write_text(json.dumps(payload), encoding="utf-8")
+    first = ConfigurationManager()
 
     # Act
-    manager = ConfigurationManager(config_file=str(config_file))
+    first.config["database"]["driver"] = "Mutated"
+    first.get("extraction")["default_resolution"] = 1
+    second = ConfigurationManager()
+
+    # Assert
+    assert second.get_database_config()["driver"] == "Psymetrix PhasorPoint"
+    assert second.get_extraction_config()["default_resolution"] == 50
+
+
+def test_configuration_manager_loads_from_file(shared_config):
+    # Act
+    manager = ConfigurationManager(config_file=str(shared_config))
 
     # Assert
     assert manager.get_database_config()["driver"] == "Custom Driver"
     assert manager.get_pmu_info(45012).station_name == "Test PMU"
 
 
-def test_get_pmu_info_handles_unknown_number():
-    # Arrange
-    manager = ConfigurationManager()
-
+def test_get_pmu_info_handles_unknown_number(default_manager):
     # Act
-    result = manager.get_pmu_info(99999)
+    result = default_manager.get_pmu_info(99999)
 
     # Assert
     assert result is None
 
 
-def test_data_quality_thresholds_return_dataclass():
-    # Arrange
-    manager = ConfigurationManager()
-
+def test_data_quality_thresholds_return_dataclass(default_manager):
     # Act
-    thresholds = manager.get_data_quality_thresholds()
+    thresholds = default_manager.get_data_quality_thresholds()
 
     # Assert
     assert thresholds.frequency_min == 45
@@ -83,12 +101,9 @@ def test_validate_raises_for_missing_sections():
     manager.validate()  # Should not raise since embedded defaults are complete
 
 
-def test_validate_passes_for_complete_config():
-    # Arrange
-    manager = ConfigurationManager()
-
+def test_validate_passes_for_complete_config(default_manager):
     # Act & Assert - should not raise
-    manager.validate()
+    default_manager.validate()
 
 
 def test_get_all_pmu_ids_returns_sorted_list():
@@ -118,13 +133,14 @@ def test_get_all_pmu_ids_returns_sorted_list():
     assert pmu_ids == [45012, 45014]
 
 
-def test_setup_configuration_files_creates_files(tmp_path, monkeypatch):
-    # Arrange - Change working directory to tmp_path for local setup
-    monkeypatch.chdir(tmp_path)
-    config_path = tmp_path / "config.json"
-    env_path = tmp_path / ".env"
+def test_setup_configuration_files_creates_files(fs, monkeypatch):
+    # Arrange - Work in an in-memory filesystem so no real files are written
+    fs.create_dir("/work")
+    monkeypatch.chdir("/work")
+    config_path = Path("/work/config.json")
+    env_path = Path("/work/.env")
 
-    # Act - Use local=True to create files in current directory (tmp_path)
+    # Act - Use local=True to create files in current directory (/work)
     ConfigurationManager.setup_configuration_files(local=True, force=True)
 
     # Assert
@@ -412,24 +428,18 @@ class TestPMULookupErrorHandling:
 class TestDottedPathAccess:
     """Test dotted notation access in get() method."""
 
-    def test_get_with_simple_key(self):
+    def test_get_with_simple_key(self, default_manager):
         """Test get() with simple key (no dots)."""
-        # Arrange
-        manager = ConfigurationManager()
-
         # Act
-        result = manager.get("database")
+        result = default_manager.get("database")
 
         # Assert
         assert result["driver"] == "Psymetrix PhasorPoint"
 
-    def test_get_with_nested_key(self):
+    def test_get_with_nested_key(self, default_manager):
         """Test get() with dotted key for nested access."""
-        # Arrange
-        manager = ConfigurationManager()
-
         # Act
-        result = manager.get("database.driver")
+        result = default_manager.get("database.driver")
 
         # Assert
         assert result == "Psymetrix PhasorPoint"
@@ -452,24 +462,18 @@ class TestDottedPathAccess:
         # Assert
         assert result == "deep_value"
 
-    def test_get_missing_nested_key_returns_default(self):
+    def test_get_missing_nested_key_returns_default(self, default_manager):
         """Test get() returns default for missing nested key."""
-        # Arrange
-        manager = ConfigurationManager()
-
         # Act
-        result = manager.get("database.missing.key", "default_value")
+        result = default_manager.get("database.missing.key", "default_value")
 
         # Assert
         assert result == "default_value"
 
-    def test_get_non_dict_intermediate_returns_default(self):
+    def test_get_non_dict_intermediate_returns_default(self, default_manager):
         """Test get() returns default when intermediate value is not dict."""
-        # Arrange
-        manager = ConfigurationManager()
-
         # Act
-        result = manager.get("database.driver.invalid", "default")
+        result = default_manager.get("database.driver.invalid", "default")
 
         # Assert
         assert result == "default"  # driver is string, can't access .invalid
@@ -9,15 +9,19 @@ import pytest
 from phasor_point_cli.connection_pool import JDBCConnectionPool
 
 
-def create_pool(mocker, max_connections=2):
-    # Mock pyodbc.connect for the lazy import in get_connection
-    mocker.patch("pyodbc.connect")
+@pytest.fixture(autouse=True)
+def pyodbc_connect(mocker):
+    """Stub pyodbc.connect for the lazy import in get_connection."""
+    return mocker.patch("pyodbc.connect")
+
+
+def create_pool(max_connections=2):
     return JDBCConnectionPool("DSN=Test", max_connections=max_connections)
 
 
-def test_pool_properties_reflect_state(mocker):
+def test_pool_properties_reflect_state():
     # Arrange
-    pool = create_pool(mocker, max_connections=3)
+    pool = create_pool(max_connections=3)
 
     # Act & Assert
     assert pool.pool_size == 3
@@ -26,7 +30,7 @@ def test_pool_properties_reflect_state(mocker):
 
 def test_pool_resize_increase_and_decrease(mocker):
     # Arrange
-    pool = create_pool(mocker, max_connections=2)
+    pool = create_pool(max_connections=2)
 
     # Act
     pool.resize(4)
@@ -48,9 +52,9 @@ def test_pool_resize_increase_and_decrease(mocker):
     second.close.assert_called_once()
 
 
-def test_pool_resize_rejects_invalid_size(mocker):
+def test_pool_resize_rejects_invalid_size():
     # Arrange
-    pool = create_pool(mocker)
+    pool = create_pool()
 
     # Act & Assert
     with pytest.raises(ValueError):
@@ -59,7 +63,7 @@ def test_pool_resize_rejects_invalid_size(mocker):
 
 def test_available_connections_updates_after_return(mocker):
     # Arrange
-    pool = create_pool(mocker)
+    pool = create_pool()
     mock_conn = mocker.MagicMock()
     pool.pool.append(mock_conn)
 
@@ -77,15 +81,14 @@ def test_available_connections_updates_after_return(mocker):
     assert pool.available_connections == 1
 
 
-def test_pool_returns_none_when_pyodbc_unavailable(mocker):
+def test_pool_returns_none_when_pyodbc_unavailable(mocker, pyodbc_connect):
     """Test that pool returns None gracefully when pyodbc import fails."""
     # Note: The actual pool exhaustion scenario is tested via connection creation failure
     # The current pool implementation doesn't track "in use" connections separately
     # from idle connections, so we test the error path instead
 
     # Arrange
-    mock_pyodbc = mocker.patch("pyodbc.connect")
-    mock_pyodbc.side_effect = ImportError("pyodbc not installed")
+    pyodbc_connect.side_effect = ImportError("pyodbc not installed")
     mock_logger = mocker.MagicMock()
 
     pool = JDBCConnectionPool("DSN=Test", max_connections=2, logger=mock_logger)
@@ -97,11 +100,10 @@ def test_pool_returns_none_when_pyodbc_unavailable(mocker):
     assert conn is None
 
 
-def test_connection_creation_failure_returns_none(mocker):
+def test_connection_creation_failure_returns_none(mocker, pyodbc_connect):
     """Test that connection creation failure returns None and logs error."""
     # Arrange
-    mock_pyodbc = mocker.patch("pyodbc.connect")
-    mock_pyodbc.side_effect = Exception("Database unreachable")
+    pyodbc_connect.side_effect = Exception("Database unreachable")
 
     mock_logger = mocker.MagicMock()
     pool = JDBCConnectionPool("DSN=Test", max_connections=2, logger=mock_logger)
@@ -118,7 +120,7 @@ def test_connection_creation_failure_returns_none(mocker):
 def test_connection_close_error_is_handled(mocker):
     """Test that connection.close() errors don't crash during cleanup."""
     # Arrange
-    pool = create_pool(mocker)
+    pool = create_pool()
     mock_conn = mocker.MagicMock()
     mock_conn.close.side_effect = Exception("Close failed")
     pool.pool.append(mock_conn)
@@ -133,7 +135,7 @@ def test_connection_close_error_is_handled(mocker):
 def test_return_connection_when_pool_full_closes_connection(mocker):
     """Test that returning a connection when pool is full closes it."""
     # Arrange
-    pool = create_pool(mocker, max_connections=2)
+    pool = create_pool(max_connections=2)
 
     # Fill the pool
     conn1 = mocker.MagicMock()
@@ -152,7 +154,7 @@ def test_return_connection_when_pool_full_closes_connection(mocker):
 def test_cleanup_with_close_errors_continues(mocker):
     """Test that cleanup continues even if some connections fail to close."""
     # Arrange
-    pool = create_pool(mocker)
+    pool = create_pool()
     mock_logger = mocker.MagicMock()
     pool.logger = mock_logger
 
@@ -175,10 +177,10 @@ def test_cleanup_with_close_errors_continues(mocker):
     assert len(pool.pool) == 0
 
 
-def test_resize_negative_size_raises_error(mocker):
+def test_resize_negative_size_raises_error():
     """Test that resizing to negative size raises ValueError."""
     # Arrange
-    pool = create_pool(mocker)
+    pool = create_pool()
 
     # Act & Assert
     with pytest.raises(ValueError) as exc_info:
@@ -190,7 +192,7 @@ def test_resize_negative_size_raises_error(mocker):
 def test_resize_with_close_errors_continues(mocker):
     """Test that resize continues even if connection close fails."""
     # Arrange
-    pool = create_pool(mocker, max_connections=3)
+    pool = create_pool(max_connections=3)
     mock_logger = mocker.MagicMock()
     pool.logger = mock_logger
 
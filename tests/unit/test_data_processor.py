@@ -31,32 +31,61 @@ def extraction_log():
     }
 
 
-def test_format_timestamps_with_precision_handles_multiple_columns():
-    # Arrange
-    df = pd.DataFrame(
+@pytest.fixture(scope="module")
+def ts_df_precision():
+    return pd.DataFrame(
         {
             "ts": pd.to_datetime(["2025-01-01 12:00:00.123456"]),
             "ts_local": pd.to_datetime(["2025-01-01 11:00:00.654321"]),
         }
     )
 
+
+@pytest.fixture(scope="module")
+def ts_df_simple():
+    return pd.DataFrame(
+        {
+            "ts": pd.to_datetime(["2025-01-01 12:00:00", "2025-01-01 12:01:00"]),
+            "value": ["1", "2"],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def ts_df_range():
+    return pd.DataFrame(
+        {"ts": pd.date_range("2025-01-01", periods=3, freq="1s"), "value": ["1", "invalid", "3"]}
+    )
+
+
+@pytest.fixture(scope="module")
+def ts_df_quality():
+    return pd.DataFrame(
+        {
+            "ts": pd.date_range("2025-01-01", periods=4, freq="1s"),
+            "value": [1, None, 3, None],
+            "f": [48, 49, 50, 52],
+        }
+    )
+
+
+def test_format_timestamps_with_precision_handles_multiple_columns(ts_df_precision):
     # Act
-    result = DataProcessor.format_timestamps_with_precision(df, ["ts", "ts_local"])
+    result = DataProcessor.format_timestamps_with_precision(
+        ts_df_precision.copy(), ["ts", "ts_local"]
+    )
 
     # Assert
     assert result["ts"].iloc[0].endswith("123")
     assert result["ts_local"].iloc[0].endswith("654")
 
 
-def test_convert_columns_to_numeric_logs_conversion(extraction_log):
+def test_convert_columns_to_numeric_logs_conversion(extraction_log, ts_df_range):
     # Arrange
-    df = pd.DataFrame(
-        {"ts": pd.date_range("2025-01-01", periods=3, freq="1s"), "value": ["1", "invalid", "3"]}
-    )
     logger = MagicMock()
 
     # Act
-    converted = DataProcessor.convert_columns_to_numeric(df.copy(), extraction_log, logger)
+    converted = DataProcessor.convert_columns_to_numeric(ts_df_range.copy(), extraction_log, logger)
 
     # Assert
     assert pd.api.types.is_numeric_dtype(converted["value"])
@@ -64,19 +93,13 @@ def test_convert_columns_to_numeric_logs_conversion(extraction_log):
     logger.info.assert_called()
 
 
-def test_clean_and_convert_types_applies_timezone_and_numeric(extraction_log):
+def test_clean_and_convert_types_applies_timezone_and_numeric(extraction_log, ts_df_simple):
     # Arrange
-    df = pd.DataFrame(
-        {
-            "ts": pd.to_datetime(["2025-01-01 12:00:00", "2025-01-01 12:01:00"]),
-            "value": ["1", "2"],
-        }
-    )
     processor = DataProcessor(logger=MagicMock())
 
     # Act
     with patch.object(DataProcessor, "get_local_timezone", return_value=pytz.timezone("UTC")):
-        result = processor.clean_and_convert_types(df.copy(), extraction_log)
+        result = processor.clean_and_convert_types(ts_df_simple.copy(), extraction_log)
 
     # Assert
     assert result is not None
@@ -84,21 +107,14 @@ def test_clean_and_convert_types_applies_timezone_and_numeric(extraction_log):
     assert pd.api.types.is_numeric_dtype(result["value"])
 
 
-def test_process_with_validation_updates_issues(extraction_log):
+def test_process_with_validation_updates_issues(extraction_log, ts_df_quality):
     # Arrange
-    df = pd.DataFrame(
-        {
-            "ts": pd.date_range("2025-01-01", periods=4, freq="1s"),
-            "value": [1, None, 3, None],
-            "f": [48, 49, 50, 52],
-        }
-    )
     processor = DataProcessor(config_manager=DummyConfigManager(), logger=MagicMock())  # type: ignore[arg-type]
 
     # Act
     with patch.object(DataProcessor, "get_local_timezone", return_value=pytz.timezone("UTC")):
         processed_df, issues = processor.process(
-            df.copy(), extraction_log, clean=True, validate=True
+            ts_df_quality.copy(), extraction_log, clean=True, validate=True
         )
 
     # Assert
@@ -107,19 +123,13 @@ def test_process_with_validation_updates_issues(extraction_log):
     assert extraction_log["data_quality"]["validation_summary"]["issues_found"] == len(issues)
 
 
-def test_process_without_clean_skips_cleaning(extraction_log):
+def test_process_without_clean_skips_cleaning(extraction_log, ts_df_simple):
     # Arrange
-    df = pd.DataFrame(
-        {
-            "ts": pd.to_datetime(["2025-01-01 12:00:00", "2025-01-01 12:01:00"]),
-            "value": ["1", "2"],
-        }
-    )
     processor = DataProcessor(config_manager=DummyConfigManager(), logger=MagicMock())  # type: ignore[arg-type]
 
     # Act
     with patch.object(DataProcessor, "clean_and_convert_types") as mock_clean:
-        processor.process(df.copy(), extraction_log, clean=False, validate=False)
+        processor.process(ts_df_simple.copy(), extraction_log, clean=False, validate=False)
 
     # Assert
     mock_clean.assert_not_called()
@@ -2,7 +2,6 @@
 Unit tests for extraction history manager.
 """
 
-from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
@@ -10,31 +9,6 @@ import pytest
 from phasor_point_cli.extraction_history import ExtractionHistory, ExtractionMetrics
 
 
-class MockConfigPathManager:
-    """Mock ConfigPathManager for testing."""
-
-    def __init__(self, temp_dir: Path):
-        self.temp_dir = temp_dir
-
-    def get_local_config_file(self) -> Path:
-        return self.temp_dir / "config.json"
-
-    def get_user_config_dir(self) -> Path:
-        return self.temp_dir
-
-
-@pytest.fixture
-def temp_history_dir(tmp_path):
-    """Create temporary directory for history file."""
-    return tmp_path
-
-
-@pytest.fixture
-def config_path_manager(temp_history_dir):
-    """Create mock config path manager."""
-    return MockConfigPathManager(temp_history_dir)
-
-
 @pytest.fixture
 def extraction_history(config_path_manager):
     """Create extraction history instance."""
@@ -4,9 +4,6 @@ Unit tests for the PowerCalculator class.
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from unittest.mock import MagicMock
-
 import numpy as np
 import pandas as pd
 import pytest
@@ -14,6 +11,7 @@ import pytest
 from phasor_point_cli.models import PhasorColumnMap
 from phasor_point_cli.power_calculator import (
     PowerCalculator,
+    _detect_columns_cached,
     apply_voltage_corrections,
     build_required_columns_list,
     calculate_power_values,
@@ -22,33 +20,84 @@ from phasor_point_cli.power_calculator import (
     log_power_calculations,
 )
 
+_COL_NAMES = (
+    "va1_m",
+    "vb1_m",
+    "vc1_m",
+    "ia1_m",
+    "ib1_m",
+    "ic1_m",
+    "va1_a",
+    "vb1_a",
+    "vc1_a",
+    "ia1_a",
+    "ib1_a",
+    "ic1_a",
+    "f",
+)
+_VOLTAGE_MAG_COLS = list(_COL_NAMES[0:3])
+_ANGLE_COLS = list(_COL_NAMES[6:12])
+_TS_INDEX = pd.date_range("2025-01-01", periods=4, freq="1s")
+# Read-only zero-copy views; DataFrame construction copies them into its own block
+_V_CONST = np.broadcast_to(230_000.0, (4,))
+_I_CONST = np.broadcast_to(400.0, (4,))
+_F_CONST = np.broadcast_to(50.0, (4,))
+
+
+def _angles(start: float, stop: float) -> np.ndarray:
+    angles = np.linspace(start, stop, 4)
+    angles.flags.writeable = False
+    return angles
+
+
+# Angle series in radians, computed once and shared read-only
+_VA_A = _angles(0.0, 0.01)
+_VB_A = _angles(-2.09, -2.08)
+_VC_A = _angles(2.09, 2.10)
+_IA_A = _angles(-0.5, -0.49)
+_IB_A = _angles(-2.59, -2.58)
+_IC_A = _angles(1.59, 1.60)
+_I1_A = _angles(-0.0466, -0.0456)
+
+
+def _build_template() -> np.ndarray:
+    template = np.empty((4, len(_COL_NAMES)), dtype=np.float64)
+    template[:, 0:3] = 230_000.0
+    template[:, 3:6] = 400.0
+    template[:, 6:12] = np.column_stack((_VA_A, _VB_A, _VC_A, _IA_A, _IB_A, _IC_A))
+    template[:, 12] = 50.0
+    return template
+
+
+_TEMPLATE = _build_template()
+
 
 def build_sample_dataframe():
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
-    return pd.DataFrame(
-        {
-            "ts": timestamps,
-            "va1_m": np.full(4, 230_000.0),
-            "vb1_m": np.full(4, 230_000.0),
-            "vc1_m": np.full(4, 230_000.0),
-            "ia1_m": np.full(4, 400.0),
-            "ib1_m": np.full(4, 400.0),
-            "ic1_m": np.full(4, 400.0),
-            "va1_a": np.linspace(0.0, 0.01, 4),
-            "vb1_a": np.linspace(-2.09, -2.08, 4),
-            "vc1_a": np.linspace(2.09, 2.10, 4),
-            "ia1_a": np.linspace(-0.5, -0.49, 4),
-            "ib1_a": np.linspace(-2.59, -2.58, 4),
-            "ic1_a": np.linspace(1.59, 1.60, 4),
-            "f": np.full(4, 50.0),
-        }
-    )
+    df = pd.DataFrame(_TEMPLATE.copy(), columns=list(_COL_NAMES))
+    df.insert(0, "ts", _TS_INDEX)
+    return df
+
+
+@pytest.fixture(scope="module")
+def sample_phasor_df():
+    # Shared read-only: PowerCalculator copies its input before modifying it
+    return build_sample_dataframe()
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    # PowerCalculator holds no state beyond its logger, so one instance serves the module
+    return PowerCalculator()
 
 
-def test_detect_columns_returns_expected_mapping():
+@pytest.fixture
+def logger_calculator(recording_logger):
+    return PowerCalculator(logger=recording_logger), recording_logger
+
+
+def test_detect_columns_returns_expected_mapping(sample_phasor_df, calculator):
     # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
+    df = sample_phasor_df
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -59,23 +108,39 @@ def test_detect_columns_returns_expected_mapping():
     assert column_map.frequency == ["f"]
 
 
-def test_apply_voltage_corrections_scales_magnitudes():
+def test_detect_columns_reuses_cached_detection_for_same_columns(sample_phasor_df, calculator):
+    # Arrange
+    df = sample_phasor_df
+    first = calculator.detect_columns(df)
+    hits_before = _detect_columns_cached.cache_info().hits
+
+    # Act
+    first.voltage_magnitude["va"] = "mutated"
+    second = calculator.detect_columns(df.copy())
+
+    # Assert
+    assert _detect_columns_cached.cache_info().hits == hits_before + 1
+    assert second.voltage_magnitude["va"] == "va1_m"
+    assert second is not first
+
+
+def test_apply_voltage_corrections_scales_magnitudes(sample_phasor_df, calculator):
     # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
+    df = sample_phasor_df
     column_map = calculator.detect_columns(df)
 
     # Act
     corrected = calculator.apply_voltage_corrections(df, column_map)
 
     # Assert
-    assert corrected["va1_m"].iloc[0] == pytest.approx(df["va1_m"].iloc[0] * np.sqrt(3))
+    np.testing.assert_allclose(
+        corrected[_VOLTAGE_MAG_COLS].to_numpy(), df[_VOLTAGE_MAG_COLS].to_numpy() * np.sqrt(3)
+    )
 
 
-def test_calculate_power_values_missing_columns_logs_issue():
+def test_calculate_power_values_missing_columns_logs_issue(sample_phasor_df, calculator):
     # Arrange
-    df: pd.DataFrame = build_sample_dataframe()[["ts", "va1_m", "ia1_m", "va1_a", "ia1_a"]]  # type: ignore[assignment]
-    calculator = PowerCalculator()
+    df: pd.DataFrame = sample_phasor_df[["ts", "va1_m", "ia1_m", "va1_a", "ia1_a"]]  # type: ignore[assignment]
     column_map = calculator.detect_columns(df)
     extraction_log = {"column_changes": {"added": []}, "issues_found": []}
 
@@ -151,105 +216,103 @@ def test_log_power_calculations_with_none():
     # Assert - no exception
 
 
-def test_apply_voltage_corrections_with_logger():
+def test_apply_voltage_corrections_with_logger(sample_phasor_df, logger_calculator):
     """Test voltage correction with logger output."""
     # Arrange
-    df = build_sample_dataframe()
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    df = sample_phasor_df
+    calculator, logger = logger_calculator
     column_map = calculator.detect_columns(df)
 
     # Act
     corrected = calculator.apply_voltage_corrections(df, column_map)
 
     # Assert
-    assert corrected["va1_m"].iloc[0] == pytest.approx(df["va1_m"].iloc[0] * np.sqrt(3))
-    logger.info.assert_called()
+    np.testing.assert_allclose(
+        corrected[_VOLTAGE_MAG_COLS].to_numpy(), df[_VOLTAGE_MAG_COLS].to_numpy() * np.sqrt(3)
+    )
+    assert any(name == "info" for name, _, _ in logger.calls)
 
 
-def test_apply_voltage_corrections_no_voltage_columns():
+def test_apply_voltage_corrections_no_voltage_columns(logger_calculator):
     """Test voltage correction warning when no voltage columns present."""
     # Arrange
     df = pd.DataFrame({"ts": [1, 2, 3], "f": [50.0, 50.0, 50.0]})
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    calculator, logger = logger_calculator
     column_map = PhasorColumnMap(voltage_magnitude={}, frequency=["f"])
 
     # Act
     calculator.apply_voltage_corrections(df, column_map)
 
     # Assert
-    logger.warning.assert_called_once()
-    assert "No voltage magnitude columns" in str(logger.warning.call_args)
+    warning_calls = [args for name, args, _ in logger.calls if name == "warning"]
+    assert len(warning_calls) == 1
+    assert "No voltage magnitude columns" in str(warning_calls[0])
 
 
-def test_convert_angles_to_degrees():
+def test_convert_angles_to_degrees(sample_phasor_df, calculator):
     """Test conversion of angles from radians to degrees."""
     # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
+    df = sample_phasor_df
     column_map = calculator.detect_columns(df)
 
     # Act
     converted = calculator.convert_angles_to_degrees(df, column_map)
 
     # Assert
-    # Radians near 0 should convert to degrees near 0
-    assert converted["va1_a"].iloc[0] == pytest.approx(np.degrees(df["va1_a"].iloc[0]))
-    assert converted["ia1_a"].iloc[0] == pytest.approx(np.degrees(df["ia1_a"].iloc[0]))
+    # Every phase angle column should be converted from radians to degrees
+    np.testing.assert_allclose(
+        converted[_ANGLE_COLS].to_numpy(), np.degrees(df[_ANGLE_COLS].to_numpy())
+    )
 
 
-def test_convert_angles_to_degrees_with_logger():
+def test_convert_angles_to_degrees_with_logger(sample_phasor_df, logger_calculator):
     """Test angle conversion with logger."""
     # Arrange
-    df = build_sample_dataframe()
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    df = sample_phasor_df
+    calculator, logger = logger_calculator
     column_map = calculator.detect_columns(df)
 
     # Act
     calculator.convert_angles_to_degrees(df, column_map)
 
     # Assert
-    logger.info.assert_called()
-    assert "Converted angle columns" in str(logger.info.call_args)
+    info_calls = [args for name, args, _ in logger.calls if name == "info"]
+    assert "Converted angle columns" in str(info_calls[-1])
 
 
-def test_convert_angles_to_degrees_no_angles():
+def test_convert_angles_to_degrees_no_angles(logger_calculator):
     """Test angle conversion warning when no angle columns present."""
     # Arrange
     df = pd.DataFrame({"ts": [1, 2, 3], "va1_m": [230000, 230000, 230000]})
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    calculator, logger = logger_calculator
     column_map = PhasorColumnMap(voltage_magnitude={"va": "va1_m"})
 
     # Act
     calculator.convert_angles_to_degrees(df, column_map)
 
     # Assert
-    logger.warning.assert_called_once()
-    assert "No phasor angle columns" in str(logger.warning.call_args)
+    warning_calls = [args for name, args, _ in logger.calls if name == "warning"]
+    assert len(warning_calls) == 1
+    assert "No phasor angle columns" in str(warning_calls[0])
 
 
-def test_detect_columns_with_positive_sequence():
+def test_detect_columns_with_positive_sequence(calculator):
     """Test detection of positive sequence current (i1) and voltage (v1) columns."""
     # Arrange
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
-            "va1_m": np.full(4, 230_000.0),
-            "va1_a": np.linspace(0.0, 0.01, 4),
-            "v1_m": np.full(4, 230_000.0),
-            "v1_a": np.linspace(0.0, 0.01, 4),
-            "ia1_m": np.full(4, 400.0),
-            "ia1_a": np.linspace(-0.5, -0.49, 4),
-            "i1_m": np.full(4, 400.0),
-            "i1_a": np.linspace(-0.0466, -0.0456, 4),
-            "f": np.full(4, 50.0),
+            "ts": _TS_INDEX,
+            "va1_m": _V_CONST,
+            "va1_a": _VA_A,
+            "v1_m": _V_CONST,
+            "v1_a": _VA_A,
+            "ia1_m": _I_CONST,
+            "ia1_a": _IA_A,
+            "i1_m": _I_CONST,
+            "i1_a": _I1_A,
+            "f": _F_CONST,
         }
     )
-    calculator = PowerCalculator()
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -261,47 +324,42 @@ def test_detect_columns_with_positive_sequence():
     assert column_map.current_angle["i1"] == "i1_a"
 
 
-def test_convert_i1_angle_to_degrees():
+def test_convert_i1_angle_to_degrees(calculator):
     """Test conversion of i1 angle from radians to degrees - fixes bug where i1 was exported in radians."""
     # Arrange
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     i1_angle_radians = np.array([-0.0466, -0.0456, -0.0446, -0.0436])
     df = pd.DataFrame(
         {
-            "ts": timestamps,
-            "i1_m": np.full(4, 400.0),
+            "ts": _TS_INDEX,
+            "i1_m": _I_CONST,
             "i1_a": i1_angle_radians,
         }
     )
-    calculator = PowerCalculator()
     column_map = calculator.detect_columns(df)
 
     # Act
     converted = calculator.convert_angles_to_degrees(df, column_map)
 
     # Assert
+    i1_degrees = converted["i1_a"].to_numpy()
     # Verify conversion: -0.0466 radians should become approximately -2.67 degrees
-    assert converted["i1_a"].iloc[0] == pytest.approx(np.degrees(i1_angle_radians[0]))
-    assert converted["i1_a"].iloc[0] == pytest.approx(-2.67, abs=0.01)
+    assert i1_degrees[0] == pytest.approx(-2.67, abs=0.01)
     # Verify all values are converted correctly
-    for i in range(4):
-        assert converted["i1_a"].iloc[i] == pytest.approx(np.degrees(i1_angle_radians[i]))
+    assert i1_degrees == pytest.approx(np.degrees(i1_angle_radians))
 
 
-def test_convert_v1_and_i1_angles_together():
+def test_convert_v1_and_i1_angles_together(calculator):
     """Test that both v1 and i1 positive sequence angles are converted correctly."""
     # Arrange
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
-            "v1_m": np.full(4, 230_000.0),
-            "v1_a": np.linspace(0.0, 0.01, 4),
-            "i1_m": np.full(4, 400.0),
-            "i1_a": np.linspace(-0.0466, -0.0456, 4),
+            "ts": _TS_INDEX,
+            "v1_m": _V_CONST,
+            "v1_a": _VA_A,
+            "i1_m": _I_CONST,
+            "i1_a": _I1_A,
         }
     )
-    calculator = PowerCalculator()
     column_map = calculator.detect_columns(df)
 
     # Act
@@ -309,26 +367,24 @@ def test_convert_v1_and_i1_angles_together():
 
     # Assert
     # Both v1 and i1 angles should be converted
-    assert converted["v1_a"].iloc[0] == pytest.approx(np.degrees(df["v1_a"].iloc[0]))
-    assert converted["i1_a"].iloc[0] == pytest.approx(np.degrees(df["i1_a"].iloc[0]))
+    assert converted.at[0, "v1_a"] == pytest.approx(np.degrees(df.at[0, "v1_a"]))
+    assert converted.at[0, "i1_a"] == pytest.approx(np.degrees(df.at[0, "i1_a"]))
     # Verify the specific i1 conversion that was failing before
-    assert converted["i1_a"].iloc[0] == pytest.approx(-2.67, abs=0.01)
+    assert converted.at[0, "i1_a"] == pytest.approx(-2.67, abs=0.01)
 
 
-def test_detect_columns_with_pmu_naming_convention():
+def test_detect_columns_with_pmu_naming_convention(calculator):
     """Test detection of i1 columns using PMU naming convention (e.g., i_tje_400_rev_i1_a)."""
     # Arrange
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
-            "i_tje_400_rev_i1_m": np.full(4, 400.0),
-            "i_tje_400_rev_i1_a": np.linspace(-0.0466, -0.0456, 4),
+            "ts": _TS_INDEX,
+            "i_tje_400_rev_i1_m": _I_CONST,
+            "i_tje_400_rev_i1_a": _I1_A,
             "i_edr_220_hrc_i1_m": np.full(4, 350.0),
             "i_edr_220_hrc_i1_a": np.linspace(-0.0500, -0.0490, 4),
         }
     )
-    calculator = PowerCalculator()
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -341,12 +397,11 @@ def test_detect_columns_with_pmu_naming_convention():
     assert column_map.current_angle["i1"] in ["i_tje_400_rev_i1_a", "i_edr_220_hrc_i1_a"]
 
 
-def test_calculate_power_values_full_success():
+def test_calculate_power_values_full_success(sample_phasor_df, logger_calculator):
     """Test full power calculation with all required columns."""
     # Arrange
-    df = build_sample_dataframe()
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    df = sample_phasor_df
+    calculator, logger = logger_calculator
     column_map = calculator.detect_columns(df)
 
     # Apply corrections first
@@ -364,23 +419,22 @@ def test_calculate_power_values_full_success():
     assert "reactive_power_mvar" in result.columns
 
     # Power values should be positive and reasonable
-    assert result["apparent_power_mva"].iloc[0] > 0
-    assert result["active_power_mw"].iloc[0] > 0
+    assert result.at[0, "apparent_power_mva"] > 0
+    assert result.at[0, "active_power_mw"] > 0
 
     # Check extraction log was updated
     assert len(extraction_log["column_changes"]["added"]) == 3
 
     # Logger should confirm success
-    logger.info.assert_called()
+    assert any(name == "info" for name, _, _ in logger.calls)
 
 
-def test_calculate_power_values_missing_voltage_angle():
+def test_calculate_power_values_missing_voltage_angle(sample_phasor_df, calculator):
     """Test power calculation when voltage angle columns are missing."""
     # Arrange
-    df: pd.DataFrame = build_sample_dataframe()[
+    df: pd.DataFrame = sample_phasor_df[
         ["ts", "va1_m", "vb1_m", "vc1_m", "ia1_m", "ib1_m", "ic1_m"]
     ]  # type: ignore[assignment]
-    calculator = PowerCalculator()
     column_map = calculator.detect_columns(df)
     extraction_log = {"column_changes": {"added": []}, "issues_found": []}
 
@@ -393,12 +447,11 @@ def test_calculate_power_values_missing_voltage_angle():
     assert extraction_log["issues_found"][0]["type"] == "missing_columns_for_calculation"
 
 
-def test_process_phasor_data_full_workflow():
+def test_process_phasor_data_full_workflow(sample_phasor_df, logger_calculator):
     """Test complete phasor data processing workflow."""
     # Arrange
-    df = build_sample_dataframe()
-    logger = MagicMock()
-    calculator = PowerCalculator(logger=logger)
+    df = sample_phasor_df
+    calculator, logger = logger_calculator
     extraction_log = {"column_changes": {"added": []}, "issues_found": []}
 
     # Act
@@ -412,11 +465,10 @@ def test_process_phasor_data_full_workflow():
     assert len(column_map.voltage_magnitude) == 3  # va, vb, vc
 
 
-def test_process_phasor_data_empty_dataframe():
+def test_process_phasor_data_empty_dataframe(calculator):
     """Test processing empty dataframe."""
     # Arrange
     df = pd.DataFrame()
-    calculator = PowerCalculator()
 
     # Act
     result_df, column_map = calculator.process_phasor_data(df)
@@ -426,11 +478,8 @@ def test_process_phasor_data_empty_dataframe():
     assert len(column_map.voltage_magnitude) == 0
 
 
-def test_process_phasor_data_none_dataframe():
+def test_process_phasor_data_none_dataframe(calculator):
     """Test processing None dataframe."""
-    # Arrange
-    calculator = PowerCalculator()
-
     # Act
     result_df, column_map = calculator.process_phasor_data(None)  # type: ignore[arg-type]
 
@@ -439,11 +488,10 @@ def test_process_phasor_data_none_dataframe():
     assert len(column_map.voltage_magnitude) == 0
 
 
-def test_process_phasor_data_without_timestamp():
+def test_process_phasor_data_without_timestamp(sample_phasor_df, calculator):
     """Test processing dataframe without timestamp column."""
     # Arrange
-    df = build_sample_dataframe().drop(columns=["ts"])
-    calculator = PowerCalculator()
+    df = sample_phasor_df.drop(columns=["ts"])
 
     # Act
     result_df, _column_map = calculator.process_phasor_data(df)
@@ -454,106 +502,74 @@ def test_process_phasor_data_without_timestamp():
 
 
 # ---------------------------------------------------------------- Wrapper Tests --
-def test_detect_phasor_columns_wrapper():
-    """Test module-level detect_phasor_columns wrapper function."""
-    # Arrange
-    df = build_sample_dataframe()
-    logger = MagicMock()
-
-    # Act
-    column_map = detect_phasor_columns(df, logger=logger)
-
-    # Assert
-    assert column_map.voltage_magnitude["va"] == "va1_m"
-    assert column_map.frequency == ["f"]
-
-
-def test_apply_voltage_corrections_wrapper():
-    """Test module-level apply_voltage_corrections wrapper function."""
-    # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
-    column_map = calculator.detect_columns(df)
-
-    # Act
-    corrected = apply_voltage_corrections(df, column_map)
-
-    # Assert
-    assert corrected["va1_m"].iloc[0] == pytest.approx(df["va1_m"].iloc[0] * np.sqrt(3))
-
-
-def test_convert_angles_to_degrees_wrapper():
-    """Test module-level convert_angles_to_degrees wrapper function."""
-    # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
-    column_map = calculator.detect_columns(df)
-
-    # Act
-    converted = convert_angles_to_degrees(df, column_map)
-
-    # Assert
-    assert converted["va1_a"].iloc[0] == pytest.approx(np.degrees(df["va1_a"].iloc[0]))
-
-
-def test_build_required_columns_list_wrapper():
-    """Test module-level build_required_columns_list wrapper function."""
-    # Arrange
-    column_map = PhasorColumnMap(
-        voltage_magnitude={"va": "va1_m"},
-        voltage_angle={"va": "va1_a"},
-        current_magnitude={"ia": "ia1_m"},
-        current_angle={"ia": "ia1_a"},
-        frequency=["f"],
-    )
-
-    # Act
-    required = build_required_columns_list(column_map)
-
-    # Assert
-    assert "va1_m" in required
-
-
-def test_log_power_calculations_wrapper():
-    """Test module-level log_power_calculations wrapper function."""
-    # Arrange
-    extraction_log = {"column_changes": {"added": []}}
-    calculated_cols = ["test_col"]
-
-    # Act
-    log_power_calculations(extraction_log, calculated_cols)
-
-    # Assert
-    assert len(extraction_log["column_changes"]["added"]) == 1
-
-
-def test_calculate_power_values_wrapper():
-    """Test module-level calculate_power_values wrapper function."""
-    # Arrange
-    df = build_sample_dataframe()
-    calculator = PowerCalculator()
-    column_map = calculator.detect_columns(df)
-    df = calculator.apply_voltage_corrections(df, column_map)
-    df = calculator.convert_angles_to_degrees(df, column_map)
-
-    # Act
-    result = calculate_power_values(df, column_map)
-
-    # Assert
-    assert "apparent_power_mva" in result.columns
-
-
-def test_detect_sequence_components_with_real_pmu_patterns():
+_DF = object()
+_COLUMN_MAP = object()
+_EXTRACTION_LOG = object()
+_LOGGER = object()
+
+# (wrapper, PowerCalculator attribute it forwards to, positional arguments,
+#  whether the wrapper builds a calculator with its logger argument)
+_WRAPPERS = [
+    (detect_phasor_columns, "detect_columns", (_DF,), True),
+    (apply_voltage_corrections, "apply_voltage_corrections", (_DF, _COLUMN_MAP), True),
+    (convert_angles_to_degrees, "convert_angles_to_degrees", (_DF, _COLUMN_MAP), True),
+    (build_required_columns_list, "build_required_columns_list", (_COLUMN_MAP,), False),
+    (log_power_calculations, "log_power_calculations", (_EXTRACTION_LOG, ["test_col"]), False),
+    (
+        calculate_power_values,
+        "calculate_power_values",
+        (_DF, _COLUMN_MAP, _EXTRACTION_LOG),
+        True,
+    ),
+]
+
+
+def test_module_level_wrappers_forward_to_power_calculator(monkeypatch):
+    """Test that each module-level wrapper delegates to its PowerCalculator counterpart."""
+    for wrapper, method_name, args, takes_logger in _WRAPPERS:
+        # Arrange
+        label = wrapper.__name__
+        calls = []
+        sentinel = object()
+
+        if takes_logger:
+
+            def fake_method(self, *call_args, _calls=calls, _sentinel=sentinel, **kwargs):
+                _calls.append((self.logger, call_args, kwargs))
+                return _sentinel
+
+            monkeypatch.setattr(PowerCalculator, method_name, fake_method)
+            expected_calls = [(_LOGGER, args, {})]
+            kwargs = {"logger": _LOGGER}
+        else:
+
+            def fake_static(*call_args, _calls=calls, _sentinel=sentinel, **kwargs):
+                _calls.append((call_args, kwargs))
+                return _sentinel
+
+            monkeypatch.setattr(PowerCalculator, method_name, staticmethod(fake_static))
+            expected_calls = [(args, {})]
+            kwargs = {}
+
+        # Act
+        result = wrapper(*args, **kwargs)
+
+        # Assert
+        assert calls == expected_calls, f"{label} forwarded {calls!r}"
+        expected_result = None if wrapper is log_power_calculations else sentinel
+        assert result is expected_result, f"{label} returned {result!r}"
+
+
+def test_detect_sequence_components_with_real_pmu_patterns(calculator):
     """Test detection of sequence components using column patterns that mimic PMU data structure.
 
     Uses synthetic test data with column naming patterns similar to real PMU exports.
     Pattern style: v_<station>_<phasor>_<suffix>
     """
     # Arrange - synthetic test data with realistic column patterns
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
+            "ts": _TS_INDEX,
             # Phase voltages (pattern: v_p3_va1_m)
             "v_p3_va1_m": np.full(4, 220_000.0),  # Test value
             "v_p3_va1_a": np.linspace(0.0, 0.02, 4),  # Test angles in radians
@@ -586,10 +602,9 @@ def test_detect_sequence_components_with_real_pmu_patterns():
             # Negative sequence current (pattern: i_p3_i2_1_m) - previously missing detection
             "i_p3_i2_1_m": np.full(4, 45.0),
             "i_p3_i2_1_a": np.array([0.3, 0.31, 0.32, 0.33]),  # Test angles in radians
-            "f": np.full(4, 50.0),
+            "f": _F_CONST,
         }
     )
-    calculator = PowerCalculator()
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -611,29 +626,30 @@ def test_detect_sequence_components_with_real_pmu_patterns():
     corrected = calculator.apply_voltage_corrections(df, column_map)
     converted = calculator.convert_angles_to_degrees(corrected, column_map)
 
+    row0 = converted.iloc[0]
+
     # Assert voltage corrections (√3 multiplier)
-    assert converted["v_p3_va1_m"].iloc[0] == pytest.approx(220_000.0 * np.sqrt(3))
-    assert converted["v_p3_v0_1_m"].iloc[0] == pytest.approx(250.0 * np.sqrt(3), rel=1e-3)
-    assert converted["v_p3_v2_1_m"].iloc[0] == pytest.approx(250.0 * np.sqrt(3), rel=1e-3)
+    assert row0["v_p3_va1_m"] == pytest.approx(220_000.0 * np.sqrt(3))
+    assert row0["v_p3_v0_1_m"] == pytest.approx(250.0 * np.sqrt(3), rel=1e-3)
+    assert row0["v_p3_v2_1_m"] == pytest.approx(250.0 * np.sqrt(3), rel=1e-3)
 
     # Assert angle conversions (radians to degrees)
-    assert converted["v_p3_v0_1_a"].iloc[0] == pytest.approx(np.degrees(0.3), rel=1e-3)
-    assert converted["v_p3_v2_1_a"].iloc[0] == pytest.approx(np.degrees(0.3), rel=1e-3)
-    assert converted["i_p3_i0_1_a"].iloc[0] == pytest.approx(np.degrees(0.3), rel=1e-3)
-    assert converted["i_p3_i2_1_a"].iloc[0] == pytest.approx(np.degrees(0.3), rel=1e-3)
+    assert row0["v_p3_v0_1_a"] == pytest.approx(np.degrees(0.3), rel=1e-3)
+    assert row0["v_p3_v2_1_a"] == pytest.approx(np.degrees(0.3), rel=1e-3)
+    assert row0["i_p3_i0_1_a"] == pytest.approx(np.degrees(0.3), rel=1e-3)
+    assert row0["i_p3_i2_1_a"] == pytest.approx(np.degrees(0.3), rel=1e-3)
 
 
-def test_detect_sequence_components_alternative_pmu_pattern():
+def test_detect_sequence_components_alternative_pmu_pattern(calculator):
     """Test detection with alternative column naming pattern (v_ta95_v0_1_m).
 
     Uses synthetic test data with alternative station identifier format.
     Pattern style: v_<station_code>_<phasor>_<suffix>
     """
     # Arrange - synthetic test data with alternative pattern
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
+            "ts": _TS_INDEX,
             # Pattern with direct station prefix (v_ta95_ instead of v_p3_)
             "v_ta95_v1_1_m": np.full(4, 210_000.0),  # Test value
             "v_ta95_v1_1_a": np.linspace(0.0, 0.015, 4),
@@ -649,7 +665,6 @@ def test_detect_sequence_components_alternative_pmu_pattern():
             "i_ta95_i2_1_a": np.array([0.25, 0.26, 0.27, 0.28]),
         }
     )
-    calculator = PowerCalculator()
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -663,17 +678,16 @@ def test_detect_sequence_components_alternative_pmu_pattern():
     assert column_map.current_magnitude["i2"] == "i_ta95_i2_1_m"
 
 
-def test_detect_sequence_components_with_no_underscore_1_suffix():
+def test_detect_sequence_components_with_no_underscore_1_suffix(calculator):
     """Test detection with pattern without _1 suffix (v_sfb_30_ta95_v1_m).
 
     Uses synthetic test data with bus measurement naming convention.
     Pattern style: v_<location>_<bus_id>_<station>_<phasor>_<suffix>
     """
     # Arrange - synthetic test data with bus measurement pattern
-    timestamps = pd.date_range(datetime(2025, 1, 1, 0, 0, 0), periods=4, freq=timedelta(seconds=1))
     df = pd.DataFrame(
         {
-            "ts": timestamps,
+            "ts": _TS_INDEX,
             # Pattern without _1 suffix (v_sfb_30_ta95_v1_m instead of v_sfb_30_ta95_v1_1_m)
             "v_sfb_30_ta95_v1_m": np.full(4, 240_000.0),  # Test value
             "v_sfb_30_ta95_v1_a": np.linspace(0.0, 0.018, 4),  # Test angles
@@ -681,7 +695,6 @@ def test_detect_sequence_components_with_no_underscore_1_suffix():
             "i_sfb_30_ta95_i1_a": np.linspace(-0.06, -0.05, 4),  # Test angles
         }
     )
-    calculator = PowerCalculator()
 
     # Act
     column_map = calculator.detect_columns(df)
@@ -4,22 +4,25 @@ Unit tests for the QueryExecutor class.
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pandas as pd
 
 from phasor_point_cli.query_executor import QueryExecutor
 
+# Shared result for patched SQL reads; the code under test only reads it
+_TINY_DF = pd.DataFrame({"value": [1, 2, 3]})
+
 
 def test_execute_success(tmp_path, monkeypatch):
     # Arrange
-    connection = MagicMock()
+    connection = SimpleNamespace(commit=lambda: None)
     pool = MagicMock()
     pool.get_connection.return_value = connection
     logger = MagicMock()
 
-    df = pd.DataFrame({"value": [1, 2, 3]})
-    monkeypatch.setattr("pandas.read_sql_query", lambda query, conn, params=None: df)
+    monkeypatch.setattr("pandas.read_sql_query", lambda query, conn, params=None: _TINY_DF)
 
     executor = QueryExecutor(pool, logger)
     output_file = tmp_path / "results.csv"
@@ -40,7 +43,7 @@ def test_execute_success(tmp_path, monkeypatch):
 def test_execute_handles_error(monkeypatch):
     # Arrange
     pool = MagicMock()
-    pool.get_connection.return_value = MagicMock()
+    pool.get_connection.return_value = SimpleNamespace(commit=lambda: None)
     logger = MagicMock()
 
     def raise_error(query, conn, params=None):
@@ -131,7 +134,7 @@ def test_execute_cursor_fallback_non_query_statement(monkeypatch):
 def test_execute_handles_query_with_database_error(monkeypatch):
     """Test handling of database errors during query execution."""
     # Arrange
-    connection = MagicMock()
+    connection = SimpleNamespace(commit=lambda: None)
     pool = MagicMock()
     pool.get_connection.return_value = connection
     logger = MagicMock()
@@ -153,7 +156,7 @@ def test_execute_handles_query_with_database_error(monkeypatch):
 def test_execute_returns_connection_on_exception(monkeypatch):
     """Test that connection is returned to pool even when exception occurs."""
     # Arrange
-    connection = MagicMock()
+    connection = SimpleNamespace(commit=lambda: None)
     pool = MagicMock()
     pool.get_connection.return_value = connection
     logger = MagicMock()
@@ -175,13 +178,12 @@ def test_execute_returns_connection_on_exception(monkeypatch):
 def test_execute_with_unsupported_output_format(monkeypatch):
     """Test handling of unsupported output format."""
     # Arrange
-    connection = MagicMock()
+    connection = SimpleNamespace(commit=lambda: None)
     pool = MagicMock()
     pool.get_connection.return_value = connection
     logger = MagicMock()
 
-    df = pd.DataFrame({"value": [1, 2, 3]})
-    monkeypatch.setattr("pandas.read_sql_query", lambda q, c, params=None: df)
+    monkeypatch.setattr("pandas.read_sql_query", lambda q, c, params=None: _TINY_DF)
 
     executor = QueryExecutor(pool, logger)
 
@@ -4,7 +4,9 @@ Unit tests for the TableManager class.
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pandas as pd
@@ -12,6 +14,9 @@ import pytest
 
 from phasor_point_cli.table_manager import TableManager
 
+# Shared result for patched SQL reads; the code under test only reads it
+_TINY_DF = pd.DataFrame({"value": [1, 2, 3]})
+
 
 @pytest.fixture
 def sample_config():
@@ -42,29 +47,30 @@ def sample_config():
     return config
 
 
+# Captures the table name in queries like "SELECT TOP 1 ts FROM <table> ..."
+_FROM_TABLE = re.compile(r"\bFROM\s+(\w+)")
+_CURSOR_SPEC = ["execute", "fetchone", "nextset", "close", "description"]
+
+
 def create_connection_mock(success_tables):
-    def make_cursor():
-        cursor = MagicMock()
+    tables = frozenset(success_tables)
 
-        def execute_side_effect(query):
-            for table in success_tables:
-                if table in query:
-                    return
-            raise Exception("Table missing")
+    def execute_side_effect(query):
+        match = _FROM_TABLE.search(query)
+        if match and match.group(1) in tables:
+            return
+        raise Exception("Table missing")
 
-        cursor.execute.side_effect = execute_side_effect
-        cursor.fetchone.return_value = (None,)
-        cursor.nextset.return_value = None  # No more result sets
-        cursor.close.return_value = None  # Allow cursor to be closed
-        return cursor
+    # The side effect is stateless, so every cursor() call can share one cursor
+    cursor = MagicMock(spec=_CURSOR_SPEC)
+    cursor.execute.side_effect = execute_side_effect
+    cursor.fetchone.return_value = (None,)
+    cursor.nextset.return_value = None  # No more result sets
+    cursor.close.return_value = None  # Allow cursor to be closed
 
     connection = MagicMock()
-    # Return a new cursor instance each time cursor() is called
-    connection.cursor.side_effect = make_cursor
-
-    # For backwards compatibility, also store first cursor
-    first_cursor = make_cursor()
-    return connection, first_cursor
+    connection.cursor.return_value = cursor
+    return connection, cursor
 
 
 def test_list_available_tables_returns_expected_mapping(sample_config):
@@ -141,8 +147,8 @@ def test_get_table_info_returns_tableinfo(mock_read_sql, sample_config):
 
     stats_conn.cursor.side_effect = make_stats_cursor
 
-    sample_conn = MagicMock()
-    mock_read_sql.return_value = pd.DataFrame({"value": [1, 2, 3]})
+    sample_conn = SimpleNamespace()  # Only handed to the patched pd.read_sql
+    mock_read_sql.return_value = _TINY_DF
 
     pool.get_connection.side_effect = [access_conn, stats_conn, sample_conn]
     manager = TableManager(pool, sample_config, logger=MagicMock())